@@ -7,18 +7,28 @@
 - Обновлены значения GWP на актуальные AR5 IPCC (2014): CH4=28, N2O=265
 - Используются централизованные константы из config.py и gwp_constants.py
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
+from itertools import starmap
+from operator import mul
 import math
 
 from config import CARBON_TO_CO2_FACTOR
 from calculations.gwp_constants import GWP_AR5_100Y
 
 
+def _drained_ch4_factor(frac_ditch: float, ef_land: float, ef_ditch: float) -> float:
+    """Удельные выбросы CH4 осушенных почв с учетом доли канав, кг CH4/га/год."""
+    return (1 - frac_ditch) * ef_land + frac_ditch * ef_ditch
+
+
 @dataclass
 class CropData:
     """Данные о сельскохозяйственной культуре."""
 
+    # Без __dict__ у экземпляра: записи создаются по одной на культуру
+    __slots__ = ('crop_type', 'yield_value', 'area', 'carbon_content')
+
     crop_type: str  # Тип культуры
     yield_value: float  # Урожайность, ц/га
     area: float  # Площадь, га
@@ -29,6 +39,8 @@ class CropData:
 class LivestockData:
     """Данные о пастбищных животных."""
 
+    __slots__ = ('animal_type', 'count', 'excretion_factor', 'grazing_time')
+
     animal_type: str  # Тип животного
     count: int  # Поголовье
     excretion_factor: float  # Коэффициент экскреции углерода
@@ -58,7 +70,27 @@ class AgriculturalLandCalculator:
         :param ef_ditch: Коэффициент для канав, кг CH4/га/год
         :return: Выбросы CH4, кг/год
         """
-        return area * ((1 - frac_ditch) * ef_land + frac_ditch * ef_ditch)
+        return area * _drained_ch4_factor(frac_ditch, ef_land, ef_ditch)
+
+    def calculate_drained_ch4_emissions_batch(
+        self,
+        areas: Iterable[float],
+        frac_ditch: float = 0.05,
+        ef_land: float = 1.4,
+        ef_ditch: float = 43.63,
+    ) -> List[float]:
+        """
+        Формула 75 для набора участков с общими коэффициентами.
+        Удельные выбросы считаются один раз, для каждого участка остается одно умножение.
+
+        :param areas: Площади осушенных почв, га
+        :param frac_ditch: Доля канав
+        :param ef_land: Коэффициент для земель, кг CH4/га/год
+        :param ef_ditch: Коэффициент для канав, кг CH4/га/год
+        :return: Выбросы CH4 по участкам, кг/год
+        """
+        factor = _drained_ch4_factor(frac_ditch, ef_land, ef_ditch)
+        return [area * factor for area in areas]
 
     def calculate_fire_emissions(
         self,
@@ -150,12 +182,9 @@ class AgriculturalLandCalculator:
         :param mineral_fertilizers: {тип: (количество, коэффициент_C)}
         :return: Углерод от удобрений, т C/год
         """
-        organic_c = sum(
-            amount * c_content for amount, c_content in organic_fertilizers.values()
-        )
-        mineral_c = sum(
-            amount * c_coef for amount, c_coef in mineral_fertilizers.values()
-        )
+        # starmap(mul) перемножает пары (количество, C) без распаковки в байткоде
+        organic_c = sum(starmap(mul, organic_fertilizers.values()))
+        mineral_c = sum(starmap(mul, mineral_fertilizers.values()))
         return organic_c + mineral_c
 
     def calculate_lime_carbon(self, lime_amount: float) -> float:
@@ -193,13 +222,15 @@ class AgriculturalLandCalculator:
         :param b_coef: Коэффициенты b для культур
         :return: Углерод от остатков, т C/год
         """
-        total_carbon = 0
-        for crop in crops:
-            a = a_coef.get(crop.crop_type, 0.3)
-            b = b_coef.get(crop.crop_type, 3.0)
-            carbon = (a * crop.yield_value + b) * crop.carbon_content * crop.area
-            total_carbon += carbon
-        return total_carbon
+        # Методы поиска коэффициентов связываются один раз до прохода по культурам
+        a_get = a_coef.get
+        b_get = b_coef.get
+        return sum(
+            (a_get(crop.crop_type, 0.3) * crop.yield_value + b_get(crop.crop_type, 3.0))
+            * crop.carbon_content
+            * crop.area
+            for crop in crops
+        )
 
     def calculate_erosion_losses(self, area: float, erosion_factor: float) -> float:
         """
@@ -273,7 +304,7 @@ class AgriculturalLandCalculator:
         :param ef_ditch: Коэффициент для канав, кг CH4/га/год
         :return: Выбросы CH4, кг/год
         """
-        return area * ((1 - frac_ditch) * ef_land + frac_ditch * ef_ditch)
+        return area * _drained_ch4_factor(frac_ditch, ef_land, ef_ditch)
 
     def calculate_agricultural_fire_emissions(
         self, area: float, biomass: float, combustion: float, emission_factor: float
@@ -359,7 +390,7 @@ class LandConversionCalculator:
         :param ef_ditch: Коэффициент для канав, кг CH4/га/год
         :return: Выбросы CH4, кг/год
         """
-        return area * ((1 - frac_ditch) * ef_land + frac_ditch * ef_ditch)
+        return area * _drained_ch4_factor(frac_ditch, ef_land, ef_ditch)
 
     def calculate_conversion_fire_emissions(
         self, area: float, biomass: float, combustion: float, emission_factor: float
@@ -386,9 +417,10 @@ class LandConversionCalculator:
         :param gas_type: Тип газа (CH4, N2O, CO2)
         :return: CO2-эквивалент, т CO2-экв
         """
-        if gas_type not in self.GWP_VALUES:
+        gwp = self.GWP_VALUES.get(gas_type)
+        if gwp is None:
             raise ValueError(
                 f"Неизвестный тип газа: {gas_type}. Доступные: {list(self.GWP_VALUES.keys())}"
             )
 
-        return gas_amount * self.GWP_VALUES[gas_type]
+        return gas_amount * gwp
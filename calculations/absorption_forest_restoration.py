@@ -8,22 +8,53 @@
 - Уточнены формулы перевода углерода в CO2
 - Используются централизованные константы из config.py и gwp_constants.py
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from itertools import repeat
+from operator import mul
 import math
 
 from config import CARBON_TO_CO2_FACTOR, N2O_N_TO_N2O_FACTOR
 from calculations.gwp_constants import GWP_AR5_100Y
+from calculations.batch_utils import check_positive, check_same_length
 
+# Множитель перевода ΔC в CO2 со знаком (формулы 11 и 25), вычисляется при импорте
+CO2_PER_CARBON_CHANGE = -CARBON_TO_CO2_FACTOR
 
-@dataclass
+# Перевод кг N-N2O в т N2O (формула 8), вычисляется при импорте
+_N2O_SCALE = N2O_N_TO_N2O_FACTOR / 1000
+
+# Хвойные породы: биомасса по формуле 3 считается только по диаметру
+CONIFER_SPECIES = frozenset(("ель", "сосна"))
+
+
+@dataclass(init=False)
 class ForestInventoryData:
     """Данные учета древостоя."""
 
+    # Без __dict__ у экземпляра: записи создаются по одной на дерево перечета.
+    # Значение count по умолчанию задается в __init__, т.к. атрибут класса
+    # с тем же именем конфликтует со слотом
+    __slots__ = ('species', 'diameter', 'height', 'count')
+
     species: str  # Порода дерева
     diameter: float  # Диаметр на высоте 1.3м, см
     height: float  # Высота, м
-    count: int = 1  # Количество деревьев
+    count: int  # Количество деревьев
+
+    def __init__(self, species: str, diameter: float, height: float, count: int = 1):
+        self.species = species
+        self.diameter = diameter
+        self.height = height
+        self.count = count
+
+
+class GrassCarbon(NamedTuple):
+    """Углерод травянистой биомассы по формулам 20-22, т C/га."""
+
+    aboveground: float  # Надземная биомасса (формула 21)
+    belowground: float  # Подземная биомасса (формула 22)
+    total: float  # Всего (формула 20)
 
 
 class ForestRestorationCalculator:
@@ -51,6 +82,14 @@ class ForestRestorationCalculator:
         },
     }
 
+    # Та же таблица с плоским ключом (порода, компонент) -> (a, b, хвойная),
+    # чтобы формула 3 обходилась одним поиском в словаре
+    _ALLOMETRIC_PARAMS = {
+        (species, component): (coeffs["a"], coeffs["b"], species in CONIFER_SPECIES)
+        for species, components in ALLOMETRIC_COEFFICIENTS.items()
+        for component, coeffs in components.items()
+    }
+
     # Коэффициенты выбросов при пожарах (Таблица 24.2)
     FIRE_EMISSION_FACTORS = {
         "CO2": 1569,  # г/кг сжигаемого вещества
@@ -58,6 +97,13 @@ class ForestRestorationCalculator:
         "N2O": 0.26,
     }
 
+    # Свойства газа для пожаров одной записью: (G_ef, ГВП), чтобы формулы 6 и 12
+    # обходились одним поиском в словаре
+    _FIRE_GAS_PROPERTIES = {
+        gas: (emission_factor, GWP_AR5_100Y[gas])
+        for gas, emission_factor in FIRE_EMISSION_FACTORS.items()
+    }
+
     def calculate_carbon_stock_change(
         self,
         biomass_change: float,
@@ -98,6 +144,32 @@ class ForestRestorationCalculator:
             raise ValueError("Период должен быть больше 0")
         return (carbon_after - carbon_before) * area / period_years
 
+    def calculate_biomass_change_batch(
+        self,
+        carbon_after: Iterable[float],
+        carbon_before: Iterable[float],
+        areas: Iterable[float],
+        period_years: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 2 для набора участков лесовосстановления.
+        Периоды проверяются один раз до расчета.
+
+        :param carbon_after: Запасы углерода после, т C/га
+        :param carbon_before: Запасы углерода до, т C/га
+        :param areas: Площади лесовосстановления, га
+        :param period_years: Продолжительности периодов, лет
+        :return: Изменения запасов по участкам, т C/год
+        """
+        carbon_after, carbon_before, areas, period_years = check_same_length(
+            carbon_after, carbon_before, areas, period_years
+        )
+        periods = check_positive(period_years, "Период должен быть больше 0")
+        return [
+            (after - before) * area / period
+            for after, before, area, period in zip(carbon_after, carbon_before, areas, periods)
+        ]
+
     def calculate_tree_biomass(
         self, diameter: float, height: float, species: str, component: str = "всего"
     ) -> float:
@@ -111,23 +183,57 @@ class ForestRestorationCalculator:
         :param component: Компонент биомассы ('надземная', 'корни', 'всего')
         :return: Биомасса, кг
         """
-        if species not in self.ALLOMETRIC_COEFFICIENTS:
-            raise ValueError(f"Неизвестная порода: {species}")
-
-        coeffs = self.ALLOMETRIC_COEFFICIENTS[species].get(component)
-        if not coeffs:
-            raise ValueError(f"Неизвестный компонент: {component}")
-
-        a, b = coeffs["a"], coeffs["b"]
+        a, b, conifer = self._allometric_params(species, component)
 
         # Формула зависит от породы
-        if species in ["ель", "сосна"]:
+        if conifer:
             # Биомасса = a × D^b
             return a * (diameter**b)
         else:
             # Биомасса = a × (D² × H)^b
             return a * ((diameter**2 * height) ** b)
 
+    def calculate_tree_biomass_batch(
+        self,
+        diameters: Iterable[float],
+        heights: Iterable[float],
+        species: Iterable[str],
+        component: str = "всего",
+    ) -> List[float]:
+        """
+        Формула 3 для набора деревьев (например, по данным перечета).
+        Коэффициенты каждой породы определяются один раз за вызов.
+
+        :param diameters: Диаметры стволов на высоте 1.3м, см
+        :param heights: Высоты деревьев, м
+        :param species: Породы деревьев
+        :param component: Компонент биомассы ('надземная', 'корни', 'всего')
+        :return: Биомасса каждого дерева, кг
+        """
+        diameters, heights, species = check_same_length(diameters, heights, species)
+        params = {}
+        result = []
+        append = result.append
+        for diameter, height, tree_species in zip(diameters, heights, species):
+            p = params.get(tree_species)
+            if p is None:
+                p = params[tree_species] = self._allometric_params(tree_species, component)
+            a, b, conifer = p
+            if conifer:
+                append(a * (diameter**b))
+            else:
+                append(a * ((diameter**2 * height) ** b))
+        return result
+
+    def _allometric_params(self, species: str, component: str) -> Tuple[float, float, bool]:
+        """Коэффициенты a, b формулы 3 и признак хвойной породы."""
+        params = self._ALLOMETRIC_PARAMS.get((species, component))
+        if params is None:
+            if species not in self.ALLOMETRIC_COEFFICIENTS:
+                raise ValueError(f"Неизвестная порода: {species}")
+            raise ValueError(f"Неизвестный компонент: {component}")
+        return params
+
     def calculate_carbon_from_biomass(self, biomass_kg: float) -> float:
         """
         Формула 4: Расчет углерода из биомассы.
@@ -152,6 +258,28 @@ class ForestRestorationCalculator:
         """
         return organic_matter_percent * depth_cm * bulk_density * 0.58
 
+    def calculate_soil_carbon_batch(
+        self,
+        organic_matter_percent: Iterable[float],
+        depth_cm: Iterable[float],
+        bulk_density: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 5 для набора участков или ячеек растра.
+
+        :param organic_matter_percent: Содержание органического вещества, %
+        :param depth_cm: Глубина отбора проб, см
+        :param bulk_density: Объемная масса почвы, г/см³
+        :return: Запасы углерода, т C/га
+        """
+        organic_matter_percent, depth_cm, bulk_density = check_same_length(
+            organic_matter_percent, depth_cm, bulk_density
+        )
+        return [
+            org * depth * density * 0.58
+            for org, depth, density in zip(organic_matter_percent, depth_cm, bulk_density)
+        ]
+
     def calculate_fire_emissions(
         self,
         burned_area: float,
@@ -174,6 +302,54 @@ class ForestRestorationCalculator:
             burned_area * available_fuel * combustion_factor * emission_factor * 0.001
         )
 
+    def calculate_fire_emissions_by_gas(
+        self,
+        burned_area: float,
+        available_fuel: float,
+        combustion_factor: float,
+    ) -> Dict[str, float]:
+        """
+        Формула 6 сразу для всех газов из FIRE_EMISSION_FACTORS.
+        Масса сгоревшего топлива A × M_B × C_f считается один раз.
+
+        :param burned_area: Выжигаемая площадь, га
+        :param available_fuel: Масса топлива, т/га
+        :param combustion_factor: Коэффициент сгорания (0.43 для верхового, 0.15 для низового)
+        :return: Выбросы по газам, т
+        """
+        burned = burned_area * available_fuel * combustion_factor
+        return {
+            gas: burned * emission_factor * 0.001
+            for gas, emission_factor in self.FIRE_EMISSION_FACTORS.items()
+        }
+
+    def calculate_fire_emissions_co2e(
+        self,
+        burned_area: float,
+        available_fuel: float,
+        combustion_factor: float,
+        gas_type: str = "CO2",
+    ) -> float:
+        """
+        Формулы 6 и 12: выбросы газа от пожаров сразу в CO2-эквиваленте.
+        CO2-экв = A × M_B × C_f × G_ef × 10^-3 × ПГП
+
+        :param burned_area: Выжигаемая площадь, га
+        :param available_fuel: Масса топлива, т/га
+        :param combustion_factor: Коэффициент сгорания (0.43 для верхового, 0.15 для низового)
+        :param gas_type: Тип газа (CO2, CH4, N2O)
+        :return: Выбросы газа, т CO2-экв
+        """
+        properties = self._FIRE_GAS_PROPERTIES.get(gas_type)
+        if properties is None:
+            raise ValueError(
+                f"Неизвестный тип газа: {gas_type}. Доступные: {list(self._FIRE_GAS_PROPERTIES)}"
+            )
+        emission_factor, gwp = properties
+        return (
+            burned_area * available_fuel * combustion_factor * emission_factor * 0.001 * gwp
+        )
+
     def calculate_drained_soil_co2(self, area: float, ef: float = 0.71) -> float:
         """
         Формула 7: Выбросы CO2 от осушенных почв.
@@ -194,7 +370,19 @@ class ForestRestorationCalculator:
         :param ef: Коэффициент выброса N2O, кг N/га/год
         :return: Выбросы N2O, т/год
         """
-        return area * ef * N2O_N_TO_N2O_FACTOR / 1000
+        return area * ef * _N2O_SCALE
+
+    def calculate_drained_soil_n2o_batch(
+        self, areas: Iterable[float], ef: float = 1.71
+    ) -> List[float]:
+        """
+        Формула 8 для набора участков с общим коэффициентом выброса.
+
+        :param areas: Площади осушенных почв, га
+        :param ef: Коэффициент выброса N2O, кг N/га/год
+        :return: Выбросы N2O по участкам, т/год
+        """
+        return [area * ef * _N2O_SCALE for area in areas]
 
     def calculate_drained_soil_ch4(
         self,
@@ -206,6 +394,7 @@ class ForestRestorationCalculator:
         """
         Формула 9: Выбросы CH4 от осушенных почв.
         CH4_organic = A × (1-Frac_ditch) × EF_land + A × Frac_ditch × EF_ditch
+        Вычисляется в приведенном виде A × (EF_land + Frac_ditch × (EF_ditch - EF_land)).
 
         :param area: Площадь, га
         :param frac_ditch: Доля канав
@@ -213,7 +402,27 @@ class ForestRestorationCalculator:
         :param ef_ditch: Коэффициент для канав, кг CH4/га/год
         :return: Выбросы CH4, кг/год
         """
-        return area * ((1 - frac_ditch) * ef_land + frac_ditch * ef_ditch)
+        return area * (ef_land + frac_ditch * (ef_ditch - ef_land))
+
+    def calculate_drained_soil_ch4_batch(
+        self,
+        areas: Iterable[float],
+        frac_ditch: float = 0.025,
+        ef_land: float = 4.5,
+        ef_ditch: float = 217,
+    ) -> List[float]:
+        """
+        Формула 9 для набора участков с общими коэффициентами.
+        Удельные выбросы считаются один раз, для каждого участка остается одно умножение.
+
+        :param areas: Площади, га
+        :param frac_ditch: Доля канав
+        :param ef_land: Коэффициент для земель, кг CH4/га/год
+        :param ef_ditch: Коэффициент для канав, кг CH4/га/год
+        :return: Выбросы CH4 по участкам, кг/год
+        """
+        factor = ef_land + frac_ditch * (ef_ditch - ef_land)
+        return [area * factor for area in areas]
 
     def calculate_fuel_emissions(
         self, fuel_volumes: Dict[str, float], emission_factors: Dict[str, float]
@@ -226,10 +435,10 @@ class ForestRestorationCalculator:
         :param emission_factors: Коэффициенты выбросов по видам
         :return: Выбросы углерода, т C
         """
-        return sum(
-            volume * emission_factors.get(fuel_type, 0)
-            for fuel_type, volume in fuel_volumes.items()
-        )
+        # Коэффициенты подбираются по ключам объемов (0 для неизвестного топлива),
+        # произведения и сумма считаются через map без цикла на Python
+        factors = map(emission_factors.get, fuel_volumes, repeat(0))
+        return sum(map(mul, fuel_volumes.values(), factors))
 
     def carbon_to_co2(self, carbon: float) -> float:
         """
@@ -243,7 +452,16 @@ class ForestRestorationCalculator:
         :param carbon: Изменение запасов углерода, т C
         :return: CO2, т (отрицательное значение = поглощение)
         """
-        return carbon * (-CARBON_TO_CO2_FACTOR)
+        return carbon * CO2_PER_CARBON_CHANGE
+
+    def carbon_to_co2_batch(self, carbon_changes: Iterable[float]) -> List[float]:
+        """
+        Формула 11 для набора изменений запасов углерода (например, по выделам).
+
+        :param carbon_changes: Изменения запасов углерода, т C
+        :return: CO2 по каждому изменению, т (отрицательное значение = поглощение)
+        """
+        return [carbon * CO2_PER_CARBON_CHANGE for carbon in carbon_changes]
 
     def to_co2_equivalent(self, gas_amount: float, gas_type: str) -> float:
         """
@@ -256,12 +474,13 @@ class ForestRestorationCalculator:
         :param gas_type: Тип газа (CH4, N2O, CO2)
         :return: CO2-эквивалент, т CO2-экв
         """
-        if gas_type not in self.GWP_VALUES:
+        gwp = self.GWP_VALUES.get(gas_type)
+        if gwp is None:
             raise ValueError(
                 f"Неизвестный тип газа: {gas_type}. Доступные: {list(self.GWP_VALUES.keys())}"
             )
 
-        return gas_amount * self.GWP_VALUES[gas_type]
+        return gas_amount * gwp
 
 
 class LandReclamationCalculator:
@@ -340,6 +559,26 @@ class LandReclamationCalculator:
         """
         return (a * (aboveground_carbon * 20) + b) * 0.45 / 10
 
+    def calculate_grass_carbon(
+        self,
+        dry_weight: float,
+        area_correction: float = 0.04,
+        a: float = 0.922,
+        b: float = 1.057,
+    ) -> GrassCarbon:
+        """
+        Формулы 21, 22 и 20 одной цепочкой для пробной площадки:
+        надземный углерод -> подземный углерод -> суммарный запас.
+
+        :param dry_weight: Абсолютно сухой вес пробы, кг
+        :param area_correction: Коэффициент площади (по умолчанию 0.04)
+        :param a, b: Коэффициенты уравнения формулы 22
+        :return: Углерод надземной, подземной и всей биомассы, т C/га
+        """
+        above = dry_weight * area_correction * 0.5
+        below = (a * (above * 20) + b) * 0.45 / 10
+        return GrassCarbon(above, below, above + below)
+
     def calculate_soil_carbon_from_organic(
         self, organic_percent: float, depth_cm: float, bulk_density: float
     ) -> float:
@@ -370,7 +609,7 @@ class LandReclamationCalculator:
 
         ВАЖНО: См. комментарий к формуле 11 в ForestRestorationCalculator
         """
-        return carbon_change * (-CARBON_TO_CO2_FACTOR)
+        return carbon_change * CO2_PER_CARBON_CHANGE
 
     def ghg_to_co2_equivalent(self, gas_amount: float, gas_type: str) -> float:
         """
@@ -383,9 +622,10 @@ class LandReclamationCalculator:
         :param gas_type: Тип газа ('CH4', 'N2O' или 'CO2')
         :return: CO2-эквивалент, т CO2-экв
         """
-        if gas_type not in self.GWP_VALUES:
+        gwp = self.GWP_VALUES.get(gas_type)
+        if gwp is None:
             raise ValueError(
                 f"Неизвестный тип газа: {gas_type}. Доступные: {list(self.GWP_VALUES.keys())}"
             )
 
-        return gas_amount * self.GWP_VALUES[gas_type]
+        return gas_amount * gwp
@@ -6,17 +6,57 @@
 ИСПРАВЛЕНИЯ:
 - Используются централизованные константы из config.py
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 from dataclasses import dataclass
 import math
 
 from config import CARBON_TO_CO2_FACTOR
+from calculations.batch_utils import check_positive, check_same_length
+
+# Перевод кг N-N2O в т N2O по 44/28 (формулы 57 и 74), вычисляется при импорте
+_N2O_SCALE = (44 / 28) / 1000
+
+
+def _budget_batch(
+    absorption: Iterable[float],
+    harvest_loss: Iterable[float],
+    fire_loss: Iterable[float],
+) -> List[float]:
+    """Годичные бюджеты углерода (абсорбция - рубки - пожары) по набору выделов."""
+    absorption, harvest_loss, fire_loss = check_same_length(absorption, harvest_loss, fire_loss)
+    return [a - h - f for a, h, f in zip(absorption, harvest_loss, fire_loss)]
+
+
+def _pool_sum_batch(
+    biomass: Iterable[float],
+    deadwood: Iterable[float],
+    litter: Iterable[float],
+    soil: Iterable[float],
+) -> List[float]:
+    """Суммы по четырем пулам углерода (формулы 55 и 72) по набору выделов."""
+    biomass, deadwood, litter, soil = check_same_length(biomass, deadwood, litter, soil)
+    return [b + d + lt + s for b, d, lt, s in zip(biomass, deadwood, litter, soil)]
+
+
+def _chronosequence_rates(
+    stocks: Sequence[float], denominators: Sequence[float]
+) -> List[float]:
+    """
+    Скорости абсорбции внутренних классов возраста (формулы 29 и 50).
+    Приращение между соседними классами считается один раз: оно входит
+    вторым слагаемым в скорость класса i и первым - в скорость класса i+1.
+    """
+    slopes = [(b - a) / d for a, b, d in zip(stocks, stocks[1:], denominators)]
+    return [s1 + s2 for s1, s2 in zip(slopes, slopes[1:])]
 
 
 @dataclass
 class ForestStandData:
     """Данные о древостое по группам возраста."""
 
+    # Без __dict__ у экземпляра: записи создаются по одной на выдел
+    __slots__ = ('age_group', 'species', 'volume', 'area', 'age_interval')
+
     age_group: int  # Группа возраста (индекс i)
     species: str  # Преобладающая порода (индекс j)
     volume: float  # Запас древесины, м³/га (V_ij)
@@ -55,6 +95,20 @@ class PermanentForestCalculator:
             raise ValueError("Площадь должна быть больше 0")
         return carbon_stock / area
 
+    def calculate_mean_carbon_per_hectare_batch(
+        self, carbon_stocks: Iterable[float], areas: Iterable[float]
+    ) -> List[float]:
+        """
+        Формула 28 для набора выделов. Площади проверяются один раз до расчета.
+
+        :param carbon_stocks: Запасы углерода, т C
+        :param areas: Площади, га
+        :return: Средние запасы, т C/га
+        """
+        carbon_stocks, areas = check_same_length(carbon_stocks, areas)
+        areas = check_positive(areas, "Площадь должна быть больше 0")
+        return [stock / area for stock, area in zip(carbon_stocks, areas)]
+
     def calculate_carbon_absorption_rate(
         self,
         mcp_current: float,
@@ -81,6 +135,20 @@ class PermanentForestCalculator:
         term2 = (mcp_next - mcp_current) / (ti_current + ti_next)
         return term1 + term2
 
+    def calculate_carbon_absorption_rates(
+        self, mean_stocks: Sequence[float], age_intervals: Sequence[float]
+    ) -> List[float]:
+        """
+        Формула 29 для всего ряда классов возраста одной породы.
+
+        :param mean_stocks: Средние запасы C по классам возраста (MCP_ij)
+        :param age_intervals: Возрастные интервалы классов (TI_ij)
+        :return: Скорости абсорбции для классов 2..n-1, т C/га/год
+        """
+        mean_stocks, age_intervals = check_same_length(mean_stocks, age_intervals)
+        denominators = [a + b for a, b in zip(age_intervals, age_intervals[1:])]
+        return _chronosequence_rates(mean_stocks, denominators)
+
     def calculate_total_absorption(self, area: float, absorption_rate: float) -> float:
         """
         Формула 30: Общая абсорбция углерода.
@@ -107,6 +175,20 @@ class PermanentForestCalculator:
             raise ValueError("Период ротации должен быть больше 0")
         return burned_area / rotation_period
 
+    def calculate_annual_disturbance_rate_fire_batch(
+        self, burned_areas: Iterable[float], rotation_periods: Iterable[float]
+    ) -> List[float]:
+        """
+        Формула 31 для набора выделов. Периоды проверяются один раз до расчета.
+
+        :param burned_areas: Площади пожаров за период, га
+        :param rotation_periods: Периоды ротации, лет
+        :return: Годичные темпы, га/год
+        """
+        burned_areas, rotation_periods = check_same_length(burned_areas, rotation_periods)
+        periods = check_positive(rotation_periods, "Период ротации должен быть больше 0")
+        return [area / period for area, period in zip(burned_areas, periods)]
+
     def calculate_annual_disturbance_rate_harvest(
         self, harvested_area: float, rotation_period: float
     ) -> float:
@@ -168,6 +250,22 @@ class PermanentForestCalculator:
         """
         return absorption - harvest_loss - fire_loss
 
+    def calculate_biomass_budget_batch(
+        self,
+        absorption: Iterable[float],
+        harvest_loss: Iterable[float],
+        fire_loss: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 35 для набора выделов за один вызов.
+
+        :param absorption: Абсорбция углерода по выделам, т C/год
+        :param harvest_loss: Потери от рубок по выделам, т C/год
+        :param fire_loss: Потери от пожаров по выделам, т C/год
+        :return: Бюджеты углерода по выделам, т C/год
+        """
+        return _budget_batch(absorption, harvest_loss, fire_loss)
+
     def calculate_deadwood_carbon_stock(
         self, volume: float, conversion_factor: float
     ) -> float:
@@ -424,6 +522,20 @@ class PermanentForestCalculator:
         term2 = (mcs_next - mcs_current) / (ti_current - ti_next)
         return term1 + term2
 
+    def calculate_soil_absorption_rates(
+        self, mean_stocks: Sequence[float], age_intervals: Sequence[float]
+    ) -> List[float]:
+        """
+        Формула 50 для всего ряда классов возраста одной породы.
+
+        :param mean_stocks: Средние запасы C в почве по классам возраста (MCS_ij)
+        :param age_intervals: Возрастные интервалы классов (TI_ij)
+        :return: Скорости абсорбции для классов 2..n-1, т C/га/год
+        """
+        mean_stocks, age_intervals = check_same_length(mean_stocks, age_intervals)
+        denominators = [a - b for a, b in zip(age_intervals, age_intervals[1:])]
+        return _chronosequence_rates(mean_stocks, denominators)
+
     def calculate_soil_total_absorption(
         self, area: float, absorption_rate: float
     ) -> float:
@@ -476,6 +588,17 @@ class PermanentForestCalculator:
         """
         return absorption - harvest_loss - fire_loss
 
+    def calculate_soil_budget_batch(
+        self,
+        absorption: Iterable[float],
+        harvest_loss: Iterable[float],
+        fire_loss: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 54 для набора выделов за один вызов.
+        """
+        return _budget_batch(absorption, harvest_loss, fire_loss)
+
     def calculate_total_budget(
         self,
         biomass_budget: float,
@@ -489,6 +612,18 @@ class PermanentForestCalculator:
         """
         return biomass_budget + deadwood_budget + litter_budget + soil_budget
 
+    def calculate_total_budget_batch(
+        self,
+        biomass_budget: Iterable[float],
+        deadwood_budget: Iterable[float],
+        litter_budget: Iterable[float],
+        soil_budget: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 55 для набора выделов за один вызов.
+        """
+        return _pool_sum_batch(biomass_budget, deadwood_budget, litter_budget, soil_budget)
+
     def calculate_drained_forest_co2(self, area: float, ef: float = 0.71) -> float:
         """
         Формула 56: Выбросы CO2 от осушения лесных почв.
@@ -509,7 +644,7 @@ class PermanentForestCalculator:
         :param ef: Коэффициент выброса, кг N/га/год
         :return: Выбросы N2O, т/год
         """
-        return area * ef * (44 / 28) / 1000
+        return area * ef * _N2O_SCALE
 
     def calculate_drained_forest_ch4(
         self,
@@ -521,8 +656,9 @@ class PermanentForestCalculator:
         """
         Формула 58: Выбросы CH4 от осушения лесных почв.
         CH4_organic = A × (1 - Frac_ditch) × EF_land + A × Frac_ditch × EF_ditch
+        Вычисляется в приведенном виде A × (EF_land + Frac_ditch × (EF_ditch - EF_land)).
         """
-        return area * ((1 - frac_ditch) * ef_land + frac_ditch * ef_ditch)
+        return area * (ef_land + frac_ditch * (ef_ditch - ef_land))
 
     def calculate_forest_fire_emissions(
         self,
@@ -560,6 +696,19 @@ class ProtectiveForestCalculator:
         """
         return area * mean_carbon
 
+    def calculate_protective_pool_dynamics(
+        self, area: float, mean_carbon_by_pool: Dict[str, float]
+    ) -> Dict[str, float]:
+        """
+        Формулы 60, 63, 66, 69 за один вызов для насаждения одной площади.
+        Запас каждого пула = S_j1 × средний запас пула.
+
+        :param area: Площадь насаждений, га
+        :param mean_carbon_by_pool: Средние запасы углерода по пулам, т C/га
+        :return: Запасы углерода по пулам, т C
+        """
+        return {pool: area * mean for pool, mean in mean_carbon_by_pool.items()}
+
     def calculate_protective_biomass_sum(self, carbon_stocks: List[float]) -> float:
         """
         Формула 61: Суммарный запас углерода в биомассе.
@@ -671,6 +820,18 @@ class ProtectiveForestCalculator:
         """
         return biomass_acc + deadwood_acc + litter_acc + soil_acc
 
+    def calculate_protective_total_accumulation_batch(
+        self,
+        biomass_acc: Iterable[float],
+        deadwood_acc: Iterable[float],
+        litter_acc: Iterable[float],
+        soil_acc: Iterable[float],
+    ) -> List[float]:
+        """
+        Формула 72 для набора защитных насаждений за один вызов.
+        """
+        return _pool_sum_batch(biomass_acc, deadwood_acc, litter_acc, soil_acc)
+
     def calculate_converted_land_co2(self, area: float, ef: float = 0.71) -> float:
         """
         Формула 73: Выбросы CO2 от осушенных почв переведенных земель.
@@ -683,4 +844,4 @@ class ProtectiveForestCalculator:
         Формула 74: Выбросы N2O от осушенных почв переведенных земель.
         N2O_organic = A × EF × 44/28
         """
-        return area * ef * (44 / 28) / 1000
+        return area * ef * _N2O_SCALE
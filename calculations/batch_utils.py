@@ -0,0 +1,27 @@
+# calculations/batch_utils.py
+"""
+Общие проверки входных данных для пакетных (*_batch) расчетов.
+"""
+from typing import Iterable, List
+
+
+def check_positive(values: Iterable[float], message: str) -> List[float]:
+    """Проверяет знаменатели пакетного расчета один раз до вычислений."""
+    values = list(values)
+    if any(v <= 0 for v in values):
+        raise ValueError(message)
+    return values
+
+
+def check_same_length(*columns: Iterable) -> List[list]:
+    """
+    Материализует параллельные входные ряды пакетного расчета и проверяет,
+    что их длины совпадают: zip() молча отбросил бы лишние элементы.
+    """
+    columns = [list(column) for column in columns]
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError(
+            "Входные ряды пакетного расчета разной длины: "
+            + ", ".join(str(len(column)) for column in columns)
+        )
+    return columns
@@ -7,13 +7,138 @@
 Версия: 2.0
 """
 
+import atexit
+import builtins
 import logging
+import marshal
 import re
-from typing import Dict, Set, List
-from sympy import sympify, Symbol, SympifyError, sqrt, exp, log, sin, cos, tan, pi, E
+import sys
+import types
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Set, List, Tuple
+import sympy
+from sympy import sympify, lambdify, SympifyError, sqrt, exp, log, sin, cos, tan, pi, E
 from sympy.core.expr import Expr
 import math
 
+from paths import FORMULA_CACHE_FILE
+
+# Версия дискового кэша: байткод зависит от версии Python, а генерируемый код - от SymPy
+_CODE_CACHE_VERSION = (1, sys.implementation.cache_tag, sympy.__version__)
+
+# Скомпилированные формулы между сессиями: {формула: (имена переменных, code)}
+_code_cache = None
+_code_cache_dirty = False
+
+
+@lru_cache(maxsize=256)
+def _parse_expression(processed_formula: str) -> Expr:
+    """Разбирает предобработанную формулу (результат кэшируется по строке)."""
+    return sympify(processed_formula, evaluate=False)
+
+
+@lru_cache(maxsize=256)
+def _free_symbol_names(processed_formula: str) -> FrozenSet[str]:
+    """Имена переменных предобработанной формулы (неизменяемое множество для кэша)."""
+    return frozenset(str(s) for s in _parse_expression(processed_formula).free_symbols)
+
+
+@lru_cache(maxsize=1)
+def _math_namespace() -> dict:
+    """Глобальное пространство имен, которое lambdify строит для модуля math."""
+    return dict(lambdify((), 0, modules="math").__globals__)
+
+
+def _evaluate_symbolic(processed_formula: str, values: List[float]) -> float:
+    """
+    Вычисляет формулу средствами SymPy при переполнении float в модуле math.
+
+    SymPy считает с произвольной точностью, поэтому слишком большой результат
+    приводится к ±inf, а не вызывает ошибку - как до компиляции формул.
+    Значения передаются в порядке аргументов скомпилированной функции.
+    """
+    expression = _parse_expression(processed_formula)
+    symbols = sorted(expression.free_symbols, key=str)
+    return float(expression.subs(dict(zip(symbols, values))).evalf())
+
+
+def _is_valid_cache_entry(formula, entry) -> bool:
+    """Проверяет запись дискового кэша: (кортеж имен переменных, объект кода)."""
+    if not isinstance(formula, str) or not isinstance(entry, tuple) or len(entry) != 2:
+        return False
+    names, code = entry
+    return (
+        isinstance(names, tuple)
+        and all(isinstance(n, str) for n in names)
+        and isinstance(code, types.CodeType)
+        and code.co_argcount == len(names)
+    )
+
+
+def _load_code_cache() -> dict:
+    """Загружает дисковый кэш при первом обращении и регистрирует его сохранение."""
+    global _code_cache
+    if _code_cache is None:
+        _code_cache = {}
+        try:
+            with open(FORMULA_CACHE_FILE, 'rb') as f:
+                version, entries = marshal.load(f)
+            if version == _CODE_CACHE_VERSION and isinstance(entries, dict):
+                _code_cache = {
+                    formula: entry for formula, entry in entries.items()
+                    if _is_valid_cache_entry(formula, entry)
+                }
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # Нет файла или он поврежден - кэш строится заново
+        atexit.register(_save_code_cache)
+    return _code_cache
+
+
+def _save_code_cache():
+    """Сохраняет дисковый кэш, если в него добавлены новые формулы."""
+    if not _code_cache_dirty:
+        return
+    try:
+        with open(FORMULA_CACHE_FILE, 'wb') as f:
+            marshal.dump((_CODE_CACHE_VERSION, _code_cache), f)
+    except OSError as e:
+        logging.getLogger(__name__).warning("Не удалось сохранить кэш формул: %s", e)
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(processed_formula: str) -> Tuple[Tuple[str, ...], Callable]:
+    """
+    Компилирует формулу в функцию Python от ее переменных.
+
+    Байткод функции сохраняется на диск, поэтому в следующих сессиях
+    формула не разбирается SymPy повторно.
+
+    Returns:
+        Кортеж (имена переменных в порядке аргументов, функция)
+    """
+    global _code_cache_dirty
+    cache = _load_code_cache()
+    entry = cache.get(processed_formula)
+    if entry is not None:
+        names, code = entry
+        try:
+            return names, types.FunctionType(code, _math_namespace())
+        except TypeError:
+            del cache[processed_formula]  # Запись непригодна - компилируем заново
+
+    expression = _parse_expression(processed_formula)
+    symbols = sorted(expression.free_symbols, key=str)
+    names = tuple(str(s) for s in symbols)
+    function = lambdify(symbols, expression, modules="math")
+
+    # Сохраняем только код, которому хватает стандартного пространства имен math
+    code = function.__code__
+    namespace = _math_namespace()
+    if all(n in namespace or hasattr(builtins, n) for n in code.co_names):
+        cache[processed_formula] = (names, code)
+        _code_cache_dirty = True
+    return names, function
+
 
 class CustomFormulaEvaluator:
     """
@@ -94,11 +219,9 @@ class CustomFormulaEvaluator:
         """
         try:
             processed_formula = self._preprocess_formula(formula_text)
-            expression = sympify(processed_formula, evaluate=False)
             
-            # Получаем все свободные символы (переменные)
-            variables = expression.free_symbols
-            var_names = {str(v) for v in variables}
+            # Свободные символы (переменные); вызывающий получает свою копию
+            var_names = set(_free_symbol_names(processed_formula))
             
             self.logger.debug(f"Parsed variables: {var_names}")
             return var_names
@@ -128,23 +251,11 @@ class CustomFormulaEvaluator:
         """
         try:
             processed_formula = self._preprocess_formula(formula_text)
-            expression = sympify(processed_formula, evaluate=False)
-            
-            # Проверяем наличие всех необходимых переменных
-            required_vars = {str(v) for v in expression.free_symbols}
-            missing_vars = required_vars - set(variables.keys())
-            
-            if missing_vars:
-                raise ValueError(
-                    f"Отсутствуют значения для переменных: {', '.join(missing_vars)}"
-                )
-            
-            # Подставляем значения переменных
-            subs_dict = {Symbol(key): value for key, value in variables.items()}
-            result = expression.subs(subs_dict)
-            
-            # Вычисляем численное значение
-            numeric_result = float(result.evalf())
+            # Разбор и компиляция выполняются один раз для каждой формулы
+            names, function = _compile_expression(processed_formula)
+            numeric_result = self._call_compiled(
+                names, function, variables, processed_formula
+            )
             
             self.logger.info(
                 f"Formula evaluated: '{formula_text}' = {numeric_result:.6f}"
@@ -158,6 +269,61 @@ class CustomFormulaEvaluator:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
+    def _call_compiled(
+        self,
+        names: Tuple[str, ...],
+        function: Callable,
+        variables: Dict[str, float],
+        processed_formula: str,
+    ) -> float:
+        """
+        Вызывает скомпилированную формулу со значениями переменных.
+
+        При переполнении float формула вычисляется SymPy (результат ±inf).
+
+        Raises:
+            ValueError: Если не хватает переменных или вычисление невозможно
+        """
+        # Проверяем наличие всех необходимых переменных
+        missing_vars = set(names) - variables.keys()
+        
+        if missing_vars:
+            raise ValueError(
+                f"Отсутствуют значения для переменных: {', '.join(missing_vars)}"
+            )
+        
+        # Вычисляем численное значение
+        values = [variables[name] for name in names]
+        try:
+            try:
+                return float(function(*values))
+            except OverflowError:
+                return _evaluate_symbolic(processed_formula, values)
+        except (ArithmeticError, ValueError, TypeError) as e:
+            # Деление на ноль, выход из области определения, комплексный результат
+            raise ValueError(f"Ошибка при вычислении формулы: {e}")
+
+    def _compile_sum_template(self, expression_template: str):
+        """
+        Компилирует шаблон блока суммирования один раз для всех индексов.
+
+        Подходит, если подстановка индекса в текст шаблона и в имена переменных
+        обработанного шаблона дает одну и ту же формулу (проверяется на j=1).
+
+        Returns:
+            Кортеж (обработанный шаблон, имена переменных шаблона, функция)
+            или None, если шаблон нужно вычислять поэлементно
+        """
+        processed_template = self._preprocess_formula(expression_template)
+        processed_first = self._preprocess_formula(expression_template.replace('_j', '_1'))
+        if processed_template.replace('_j', '_1') != processed_first:
+            return None
+        try:
+            names, function = _compile_expression(processed_template)
+        except Exception:
+            return None  # Ошибку разбора покажет поэлементный расчет
+        return processed_template, names, function
+
     def evaluate_sum_block(
         self,
         expression_template: str,
@@ -193,6 +359,9 @@ class CustomFormulaEvaluator:
             raise ValueError("Список переменных для суммирования пуст")
         
         total_sum = 0.0
+        # Шаблон разбирается и компилируется один раз, для элемента i
+        # меняются только имена переменных: FC_j -> FC_i
+        compiled = self._compile_sum_template(expression_template)
         
         for i, variables in enumerate(variables_by_index, start=1):
             # Заменяем '_j' на '_i' в шаблоне выражения
@@ -200,7 +369,14 @@ class CustomFormulaEvaluator:
             
             try:
                 # Вычисляем текущий элемент суммы
-                element_result = self.evaluate(current_expression, variables)
+                if compiled is not None:
+                    processed_template, names, function = compiled
+                    index_names = tuple(name.replace('_j', f'_{i}') for name in names)
+                    element_result = self._call_compiled(
+                        index_names, function, variables, processed_template
+                    )
+                else:
+                    element_result = self.evaluate(current_expression, variables)
                 total_sum += element_result
                 
                 self.logger.debug(
@@ -366,7 +542,7 @@ class CustomFormulaEvaluator:
         """
         try:
             processed = self._preprocess_formula(formula_text)
-            sympify(processed, evaluate=False)
+            _parse_expression(processed)
             return True, ""
         except Exception as e:
             return False, str(e)
@@ -8,6 +8,9 @@
 Источник: IPCC Fifth Assessment Report: Climate Change 2013
 The Physical Science Basis, Chapter 8, Table 8.7
 """
+from typing import Iterable, List
+
+from calculations.batch_utils import check_same_length
 
 # Основные потенциалы глобального потепления (GWP) за 100 лет
 # Используются в расчетах поглощения и выбросов парниковых газов
@@ -55,13 +58,41 @@ def get_co2_equivalent(gas_amount: float, gas_type: str) -> float:
     :return: CO2-эквивалент, тонн
     :raises ValueError: Если тип газа неизвестен
     """
-    if gas_type not in GWP_VALUES:
-        raise ValueError(
-            f"Неизвестный тип газа: '{gas_type}'. "
-            f"Доступные: {', '.join(GWP_VALUES.keys())}"
-        )
+    gwp = GWP_VALUES.get(gas_type)
+    if gwp is None:
+        raise _unknown_gas_error(gas_type)
+
+    return gas_amount * gwp
 
-    return gas_amount * GWP_VALUES[gas_type]
+
+def get_co2_equivalent_batch(
+    gas_amounts: Iterable[float], gas_types: Iterable[str]
+) -> List[float]:
+    """
+    Переводит набор количеств газов в CO2-эквивалент.
+
+    :param gas_amounts: Массы газов, тонн
+    :param gas_types: Типы газов в том же порядке
+    :return: CO2-эквиваленты, тонн
+    :raises ValueError: Если тип газа неизвестен
+    """
+    gas_amounts, gas_types = check_same_length(gas_amounts, gas_types)
+    gwp_get = GWP_VALUES.get
+    result = []
+    for gas_amount, gas_type in zip(gas_amounts, gas_types):
+        gwp = gwp_get(gas_type)
+        if gwp is None:
+            raise _unknown_gas_error(gas_type)
+        result.append(gas_amount * gwp)
+    return result
+
+
+def _unknown_gas_error(gas_type: str) -> ValueError:
+    """Ошибка для газа, которого нет в таблице GWP."""
+    return ValueError(
+        f"Неизвестный тип газа: '{gas_type}'. "
+        f"Доступные: {', '.join(GWP_VALUES.keys())}"
+    )
 
 
 def carbon_to_co2(carbon_mass: float, absorption: bool = True) -> float:
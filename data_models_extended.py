@@ -1,8 +1,10 @@
 # data_models.py - Данные таблиц из методики расчета выбросов.
 # Код исправлен и дополнен в соответствии с Приказом Минприроды РФ от 27.05.2022 N 371.
 # Комментарии на русском. Поддержка UTF-8.
-from typing import Dict, Optional, List
-from dataclasses import dataclass
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Optional, List, NamedTuple
 # Таблица 1.1: Коэффициенты перевода, EF_CO2, W_C по видам топлива
 TABLE_1_1 = {
     # Жидкие топлива
@@ -632,9 +634,46 @@ class DataService:
     def get_ferroalloy_products(self):
         return FERROALLOY_PRODUCTS
 
-@dataclass
-class RegionalForestData:
-    """Данные по лесам для субъектов РФ."""
+# Интернированные ключи таблиц поглощения. Передавайте эти константы в get_*
+# методы ExtendedDataService: поиск по тому же объекту строки не пересчитывает
+# хеш кириллической строки. Обычные строки по-прежнему поддерживаются.
+SPECIES = SimpleNamespace(
+    SPRUCE=sys.intern('ель'),
+    PINE=sys.intern('сосна'),
+    BIRCH=sys.intern('береза'),
+)
+
+FRACTION = SimpleNamespace(
+    ABOVE=sys.intern('надземная'),
+    ROOTS=sys.intern('корни'),
+    TOTAL=sys.intern('всего'),
+)
+
+GAS = SimpleNamespace(
+    CO2=sys.intern('CO2'),
+    CH4=sys.intern('CH4'),
+    N2O=sys.intern('N2O'),
+)
+
+# Позиции газов в строках таблицы коэффициентов выбросов при пожарах
+GAS_IDX = {GAS.CO2: 0, GAS.CH4: 1, GAS.N2O: 2}
+
+LAND_TYPE = SimpleNamespace(
+    FOREST=sys.intern('леса'),
+    CROP_RESIDUES=sys.intern('сельхоз_остатки'),
+    FORAGE_LANDS=sys.intern('кормовые_угодья'),
+    FOREST_LANDS=sys.intern('лесные_земли'),
+    ARABLE_LANDS=sys.intern('пахотные_земли'),
+)
+
+
+class RegionalForestData(NamedTuple):
+    """
+    Данные по лесам для субъектов РФ.
+
+    Хранится как кортеж: без __dict__ у каждого экземпляра, доступ к полям
+    по имени такой же, как у dataclass.
+    """
     region: str
     # Покрытые лесом земли
     above_biomass: float  # Надземная биомасса, т C/га
@@ -650,8 +689,54 @@ class RegionalForestData:
     shrub_soil: float  # Почва под кустарниками, т C/га
 
 
+# Таблица 24: Коэффициенты аллометрических уравнений (только для чтения)
+ALLOMETRIC_COEFFICIENTS = {
+    SPECIES.SPRUCE: {
+        FRACTION.ABOVE: {'a': 0.0533, 'b': 0.8955},
+        FRACTION.ROOTS: {'a': 0.0239, 'b': 0.8408},
+        FRACTION.TOTAL: {'a': 0.1237, 'b': 0.8332}
+    },
+    SPECIES.PINE: {
+        FRACTION.ABOVE: {'a': 0.0217, 'b': 0.9817},
+        FRACTION.ROOTS: {'a': 0.0387, 'b': 0.7281},
+        FRACTION.TOTAL: {'a': 0.0557, 'b': 0.9031}
+    },
+    SPECIES.BIRCH: {
+        FRACTION.ABOVE: {'a': 0.5443, 'b': 0.6527},
+        FRACTION.ROOTS: {'a': 0.0387, 'b': 0.7281},
+        FRACTION.TOTAL: {'a': 0.0557, 'b': 0.9031}
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _allometric_coefficients(species: str, fraction: str) -> Optional[Dict[str, float]]:
+    """Коэффициенты Таблицы 24 по породе (без учета регистра) и фракции."""
+    species_data = ALLOMETRIC_COEFFICIENTS.get(species.lower())
+    if species_data:
+        return species_data.get(fraction)
+    return None
+
+
 class ExtendedDataService:
     """Расширенный сервис данных с таблицами для поглощения ПГ."""
+
+    # Фиксированный набор таблиц: без __dict__ у экземпляра и с быстрым
+    # доступом к атрибутам в get_* методах
+    __slots__ = (
+        'allometric_coefficients',
+        'fire_emission_factors',
+        'fuel_mass_forest',
+        'regional_carbon_stocks',
+        'regional_total_carbon',
+        'grassland_productivity',
+        'drained_soil_factors',
+        'organic_fertilizer_carbon',
+        'mineral_fertilizer_carbon',
+        'crop_residue_equations',
+        'livestock_carbon_factors',
+        'soil_respiration_rates',
+    )
     
     def __init__(self):
         self._init_forest_coefficients()
@@ -663,41 +748,14 @@ class ExtendedDataService:
         """Инициализация коэффициентов для лесных расчетов."""
         
         # Таблица 24: Коэффициенты аллометрических уравнений
-        self.allometric_coefficients = {
-            'ель': {
-                'надземная': {'a': 0.0533, 'b': 0.8955},
-                'корни': {'a': 0.0239, 'b': 0.8408},
-                'всего': {'a': 0.1237, 'b': 0.8332}
-            },
-            'сосна': {
-                'надземная': {'a': 0.0217, 'b': 0.9817},
-                'корни': {'a': 0.0387, 'b': 0.7281},
-                'всего': {'a': 0.0557, 'b': 0.9031}
-            },
-            'береза': {
-                'надземная': {'a': 0.5443, 'b': 0.6527},
-                'корни': {'a': 0.0387, 'b': 0.7281},
-                'всего': {'a': 0.0557, 'b': 0.9031}
-            }
-        }
+        self.allometric_coefficients = ALLOMETRIC_COEFFICIENTS
         
         # Таблица 24.2: Коэффициенты выбросов при пожарах
+        # Строки таблицы: (CO2, CH4, N2O) в порядке GAS_IDX, г/кг сжигаемого вещества
         self.fire_emission_factors = {
-            'леса': {
-                'CO2': 1569.0,  # г/кг сжигаемого вещества
-                'CH4': 4.7,
-                'N2O': 0.26
-            },
-            'сельхоз_остатки': {
-                'CO2': 1515.0,
-                'CH4': 2.7,
-                'N2O': 0.07
-            },
-            'кормовые_угодья': {
-                'CO2': 1613.0,
-                'CH4': 2.3,
-                'N2O': 0.21
-            }
+            LAND_TYPE.FOREST: (1569.0, 4.7, 0.26),
+            LAND_TYPE.CROP_RESIDUES: (1515.0, 2.7, 0.07),
+            LAND_TYPE.FORAGE_LANDS: (1613.0, 2.3, 0.21),
         }
         
         # Таблица 25.6: Масса доступного топлива для пожаров
@@ -747,6 +805,13 @@ class ExtendedDataService:
             ),
             # Добавить остальные регионы...
         }
+
+        # Суммарный запас углерода покрытых лесом земель (считается один раз)
+        self.regional_total_carbon = {
+            region: data.above_biomass + data.below_biomass + data.deadwood
+            + data.litter + data.soil
+            for region, data in self.regional_carbon_stocks.items()
+        }
         
         # Таблица 27.3: Продуктивность сенокосов и пастбищ по регионам
         self.grassland_productivity = {
@@ -763,23 +828,23 @@ class ExtendedDataService:
         
         # Коэффициенты выбросов от осушенных почв
         self.drained_soil_factors = {
-            'лесные_земли': {
-                'CO2': 0.71,  # т C/га/год
-                'N2O': 1.71,  # кг N/га/год
+            LAND_TYPE.FOREST_LANDS: {
+                GAS.CO2: 0.71,  # т C/га/год
+                GAS.N2O: 1.71,  # кг N/га/год
                 'CH4_frac_ditch': 0.025,
                 'CH4_ef_land': 4.5,  # кг CH4/га/год
                 'CH4_ef_ditch': 217  # кг CH4/га/год
             },
-            'пахотные_земли': {
-                'CO2': 5.9,  # т C/га/год
-                'N2O': 7.0,  # кг N-N2O/га/год
+            LAND_TYPE.ARABLE_LANDS: {
+                GAS.CO2: 5.9,  # т C/га/год
+                GAS.N2O: 7.0,  # кг N-N2O/га/год
                 'CH4_frac_ditch': 0.5,
                 'CH4_ef_land': 0.0,
                 'CH4_ef_ditch': 1165
             },
-            'кормовые_угодья': {
-                'CO2': 5.82,  # т C/га/год
-                'N2O': 9.5,  # кг N-N2O/га/год
+            LAND_TYPE.FORAGE_LANDS: {
+                GAS.CO2: 5.82,  # т C/га/год
+                GAS.N2O: 9.5,  # кг N-N2O/га/год
                 'CH4_frac_ditch': 0.05,
                 'CH4_ef_land': 1.4,
                 'CH4_ef_ditch': 43.63
@@ -876,13 +941,10 @@ class ExtendedDataService:
     def get_allometric_coefficients(
         self,
         species: str,
-        fraction: str = 'всего'
+        fraction: str = FRACTION.TOTAL
     ) -> Optional[Dict[str, float]]:
         """Получить коэффициенты аллометрических уравнений."""
-        species_data = self.allometric_coefficients.get(species.lower())
-        if species_data:
-            return species_data.get(fraction)
-        return None
+        return _allometric_coefficients(species, fraction)
     
     def get_fire_emission_factor(
         self,
@@ -891,8 +953,9 @@ class ExtendedDataService:
     ) -> Optional[float]:
         """Получить коэффициент выбросов при пожарах."""
         land_data = self.fire_emission_factors.get(land_type)
-        if land_data:
-            return land_data.get(gas_type)
+        gas_index = GAS_IDX.get(gas_type)
+        if land_data and gas_index is not None:
+            return land_data[gas_index]
         return None
     
     def get_regional_carbon_stocks(
@@ -902,6 +965,17 @@ class ExtendedDataService:
         """Получить данные по запасам углерода для региона."""
         return self.regional_carbon_stocks.get(region)
     
+    def get_total_carbon(
+        self,
+        region: str
+    ) -> Optional[float]:
+        """Получить суммарный запас углерода покрытых лесом земель региона, т C/га."""
+        return self.regional_total_carbon.get(region)
+    
+    def get_total_carbon_all(self) -> Dict[str, float]:
+        """Получить суммарные запасы углерода по всем регионам, т C/га."""
+        return dict(self.regional_total_carbon)
+    
     def get_drained_soil_factors(
         self,
         land_type: str
@@ -1,22 +1,46 @@
 # logger_config.py - Конфигурация системы логирования.
 # Комментарии на русском. Поддержка UTF-8.
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+
+from paths import LOG_FILE, get_user_data_dir
+
+# Фоновый обработчик очереди логов (создается один раз за процесс)
+_listener = None
 
 
 def setup_logging(level=logging.WARNING):
     """
     Настраивает конфигурацию логирования для всего приложения.
 
+    Записи попадают в очередь через QueueHandler, а запись в файл и консоль
+    выполняет QueueListener в отдельном потоке, поэтому дисковый ввод-вывод
+    не блокирует главный поток Qt. Повторный вызов только меняет уровень.
+
     Args:
         level: Уровень логирования (по умолчанию WARNING для production)
                Используйте logging.DEBUG для разработки
     """
+    global _listener
+
+    # Формат не использует поток, процесс и место вызова - не собираем их для
+    # каждой записи. _srcfile = None отключает обход стека в Logger.findCaller
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     logger = logging.getLogger()
     logger.setLevel(level)
 
+    # Обработчики уже запущены - файл повторно не открываем
+    if _listener is not None:
+        return
+
     if logger.hasHandlers():
         logger.handlers.clear()
 
@@ -26,18 +50,33 @@ def setup_logging(level=logging.WARNING):
     )
 
     # Файловый handler - всегда включен
+    get_user_data_dir()
     file_handler = RotatingFileHandler(
-        "logs/ghg_calculator.log", maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
+        LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.INFO)  # В файл пишем INFO и выше
-    logger.addHandler(file_handler)
+
+    # Буфер записей: файл пишется пачками, ERROR и выше сбрасываются сразу
+    buffered_file_handler = MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_file_handler.setLevel(logging.INFO)
+    atexit.register(buffered_file_handler.flush)
 
     # Stream handler - только для WARNING и выше (меньше шума в консоли)
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
     stream_handler.setLevel(logging.WARNING)
-    logger.addHandler(stream_handler)
+
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(
+        log_queue, buffered_file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
 
     # Используем lazy evaluation для логирования
     if level <= logging.INFO:
@@ -9,29 +9,27 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 from ui.main_window_extended import ExtendedMainWindow
-from paths import LOG_FILE
-
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        logging.StreamHandler()
-    ],
-)
+from logger_config import setup_logging
+from config import APP_NAME, APP_ORGANIZATION
 
 
 def main():
+    # Единственная точка настройки логирования
+    setup_logging(logging.INFO)
+
     app = QApplication(sys.argv)
-    app.setApplicationName("GHG Calculator Extended")
-    app.setOrganizationName("GHG Team")
+    app.setApplicationName(APP_NAME)
+    app.setOrganizationName(APP_ORGANIZATION)
 
     # Используем расширенное главное окно
     window = ExtendedMainWindow()
     window.show()
 
+    # Таблицы коэффициентов строим после первой отрисовки окна
+    QTimer.singleShot(0, window.calculator_factory.get_extended_data_service)
+
     sys.exit(app.exec())
 
 
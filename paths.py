@@ -29,7 +29,7 @@ def ensure_directory(path):
     try:
         path.mkdir(parents=True, exist_ok=True)
     except Exception as e:
-        logging.error(f"Не удалось создать директорию {path}: {e}")
+        logging.error("Не удалось создать директорию %s: %s", path, e)
 
 
 # Ленивая инициализация - создаем директории только при первом обращении
@@ -43,6 +43,7 @@ def get_user_data_dir():
 LIBRARY_FILE = USER_DATA_DIR / "formulas_library.json"
 LOG_FILE = USER_DATA_DIR / "ghg_calculator.log"
 CONFIG_FILE = USER_DATA_DIR / "config.json"
+FORMULA_CACHE_FILE = USER_DATA_DIR / "formula_cache.bin"
 
 # Директория для экспорта
 EXPORT_DIR = USER_DATA_DIR / "exports"
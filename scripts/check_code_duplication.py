@@ -1,82 +1,241 @@
 """
 Скрипт для поиска дублирования кода в проекте
 """
+import ast
+import mmap
+import io
 import re
 import os
 import sys
 from pathlib import Path
-from collections import defaultdict
-import hashlib
+from datetime import datetime
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import List
+
+# Параметры полиномиального хеша Рабина-Карпа (модуль - простое Мерсенна 2^61-1).
+# Два основания дают составной ключ окна и исключают случайные коллизии;
+# оба хеша упаковываются в одно целое число (HASH_BITS бит на каждый).
+HASH_BITS = 61
+HASH_MOD = (1 << HASH_BITS) - 1
+HASH_BASE = 1_000_003
+HASH_BASE_2 = 911_382_323
+
+# Ширина окна winnowing: из каждых WINNOW_WINDOW соседних блоков сохраняется
+# один отпечаток. Гарантированно находятся дубликаты от min_lines + 3 строк.
+WINNOW_WINDOW = 4
+
+# Ключ для слишком коротких блоков - больше любого хеша, в отпечатки не попадает
+_SKIP_KEY = 1 << (2 * HASH_BITS)
+
+# Регулярные выражения компилируются один раз при загрузке модуля
+# (METHOD_RE - запасной вариант для файлов, которые не разбирает ast)
+METHOD_RE = re.compile(r'def\s+(\w+)\s*\([^)]*\)\s*(?:->.*?)?:')
+COMMENT_RE = re.compile(r'#.*$')
+WS_RE = re.compile(r'\s+')
+
+# Файлы больше этого размера анализируются, только если начало похоже на код
+MAX_SOURCE_SIZE = 1 << 20
+HEAD_SIZE = 4096
+PYTHON_MARKERS = (b'def ', b'import ', b'class ', b'#!')
+
+# Файлы от этого размера читаются через mmap (для мелких дороже обычного read)
+MMAP_THRESHOLD = 64 * 1024
 
 # Установка кодировки UTF-8 для вывода
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
-
-def extract_methods(filepath):
-    """Извлекает методы из Python файла"""
-    methods = []
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+@dataclass
+class FileInfo:
+    """Содержимое файла и извлеченные из него данные (файл читается один раз)"""
+    path: Path
+    text: str
+    lines: List[str]
+    imports: List[str] = field(default_factory=list)
+    methods: List[str] = field(default_factory=list)
+
+def extract_methods(text, filepath=None):
+    """Извлекает методы из текста Python файла по его синтаксическому дереву"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-            # Ищем определения методов
-            method_pattern = r'def\s+(\w+)\s*\([^)]*\)\s*(?:->.*?)?:'
-            for match in re.finditer(method_pattern, content):
-                methods.append(match.group(1))
-
-    except Exception as e:
-        print(f"Ошибка при чтении {filepath}: {e}")
-
-    return methods
+        tree = ast.parse(text, filename=str(filepath))
+    except SyntaxError:
+        # Файл с ошибкой синтаксиса разбираем по регулярному выражению
+        return [match.group(1) for match in METHOD_RE.finditer(text)]
+
+    return [
+        node.name for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
 
-def extract_imports(filepath):
-    """Извлекает импорты из файла"""
+def extract_imports(lines):
+    """Извлекает импорты из строк файла"""
     imports = []
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('import ') or line.startswith('from '):
-                    imports.append(line)
-    except:
-        pass
+    for line in lines:
+        line = line.strip()
+        if line.startswith('import ') or line.startswith('from '):
+            imports.append(line)
     return imports
 
-def find_similar_code_blocks(project_root, min_lines=10):
-    """Ищет похожие блоки кода"""
-    ui_dir = project_root / "ui"
-    calc_dir = project_root / "calculations"
-
-    # Хэши блоков кода
-    code_blocks = defaultdict(list)
-
-    for directory in [ui_dir, calc_dir]:
-        for filepath in directory.glob("*.py"):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-
-                # Разбиваем на блоки по min_lines строк
-                for i in range(len(lines) - min_lines + 1):
-                    block = ''.join(lines[i:i+min_lines])
-                    # Удаляем пробелы и комментарии для сравнения
-                    normalized = re.sub(r'#.*$', '', block, flags=re.MULTILINE)
-                    normalized = re.sub(r'\s+', ' ', normalized).strip()
-
-                    if len(normalized) > 50:  # Игнорируем слишком короткие блоки
-                        block_hash = hashlib.md5(normalized.encode()).hexdigest()
-                        code_blocks[block_hash].append((filepath, i+1, min_lines))
-            except:
-                pass
-
-    # Находим дубликаты
-    duplicates = {k: v for k, v in code_blocks.items() if len(v) > 1}
-    return duplicates
+def list_py_files(directory):
+    """Список .py файлов каталога за один проход os.scandir"""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.py') and entry.is_file()
+        ]
+
+def is_source_head(head, size):
+    """По первым 4 КБ решает, похож ли файл на исходный код"""
+    if b'\x00' in head:
+        return False
+    if size > MAX_SOURCE_SIZE:
+        return any(marker in head for marker in PYTHON_MARKERS)
+    return True
+
+def read_source(filepath):
+    """
+    Читает текст файла или возвращает None для двоичных файлов и крупных
+    артефактов, не похожих на исходный код (решение по первым 4 КБ).
+    Крупные файлы отображаются в память и декодируются без копии в bytes.
+    """
+    with open(filepath, 'rb', buffering=1 << 17) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            head = f.read(HEAD_SIZE)
+            if not is_source_head(head, size):
+                return None
+            return (head + f.read()).decode('utf-8')
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if not is_source_head(mm[:HEAD_SIZE], size):
+                return None
+            return str(mm, 'utf-8')
+
+def scan_file(filepath):
+    """Читает файл один раз и собирает все данные для анализа"""
+    try:
+        text = read_source(filepath)
+    except Exception as e:
+        print(f"Ошибка при чтении {filepath}: {e}")
+        return None
+    if text is None:
+        return None
+
+    lines = text.splitlines()
+    return FileInfo(
+        path=filepath,
+        text=text,
+        lines=lines,
+        imports=extract_imports(lines),
+        methods=extract_methods(text, filepath),
+    )
+
+def normalize_line(line):
+    """Удаляет комментарий и схлопывает пробелы в строке кода"""
+    line = COMMENT_RE.sub('', line)
+    return WS_RE.sub(' ', line).strip()
+
+def iter_block_keys(lines, window):
+    """
+    Потоковый проход по строкам: ключ каждого блока из window подряд идущих
+    строк. Хранится только окно из window строк, хеши Рабина-Карпа обоих
+    оснований обновляются за O(1) при сдвиге окна.
+    """
+    top = pow(HASH_BASE, window - 1, HASH_MOD)
+    top_2 = pow(HASH_BASE_2, window - 1, HASH_MOD)
+    # Пары (хеш строки, длина строки в нормализованном блоке с пробелом)
+    block = deque()
+    primary = secondary = 0
+    window_len = 0
+
+    for line in lines:
+        # Нормализуем каждую строку один раз (без пробелов и комментариев)
+        norm_line = normalize_line(line)
+        # Встроенный hash() строки: без кодирования в bytes и внешних библиотек
+        line_hash = hash(norm_line) % HASH_MOD
+        line_len = len(norm_line) + 1 if norm_line else 0
+
+        if len(block) == window:
+            old_hash, old_len = block.popleft()
+            primary -= old_hash * top
+            secondary -= old_hash * top_2
+            window_len -= old_len
+
+        block.append((line_hash, line_len))
+        primary = (primary * HASH_BASE + line_hash) % HASH_MOD
+        secondary = (secondary * HASH_BASE_2 + line_hash) % HASH_MOD
+        window_len += line_len
+
+        if len(block) == window:
+            # Игнорируем слишком короткие блоки
+            if window_len - 1 > 50:
+                yield (primary << HASH_BITS) | secondary
+            else:
+                yield _SKIP_KEY
+
+def winnow(keys, window=WINNOW_WINDOW):
+    """
+    Отбор отпечатков методом winnowing: в каждом окне из window подряд
+    идущих ключей берется крайний правый минимум, каждый индекс один раз.
+    Ключи читаются потоком, в памяти держится не больше window кандидатов.
+    """
+    candidates = deque()
+    last = None
+    count = 0
+    for i, key in enumerate(keys):
+        count += 1
+        while candidates and candidates[-1][1] >= key:
+            candidates.pop()
+        candidates.append((i, key))
+        if candidates[0][0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 and candidates[0][0] != last:
+            last, min_key = candidates[0]
+            if min_key != _SKIP_KEY:
+                yield last, min_key
+
+    # Блоков меньше, чем ширина окна: один отпечаток на весь файл
+    if 0 < count < window:
+        index, min_key = candidates[0]
+        if min_key != _SKIP_KEY:
+            yield index, min_key
+
+def file_fingerprints(info, min_lines):
+    """Отпечатки winnowing блоков по min_lines строк файла: пары (индекс, ключ)"""
+    return winnow(iter_block_keys(info.lines, min_lines))
+
+def find_similar_code_blocks(files, min_lines=10):
+    """
+    Ищет похожие блоки кода.
+    Файлы обрабатываются последовательно за один проход: для каждого
+    отпечатка хранится лишь первое место, а полный список мест заводится
+    только при повторе, поэтому отпечатки всех файлов не держатся в памяти.
+    """
+    # Место блока - пара (индекс файла в files, номер строки): длина блока
+    # одинакова для всех и не хранится в каждой записи
+    first_seen = {}
+    duplicates = defaultdict(list)
+    for file_index, info in enumerate(files):
+        for i, block_key in file_fingerprints(info, min_lines):
+            location = (file_index, i+1)
+            first = first_seen.setdefault(block_key, location)
+            if first is location:
+                continue
+            if block_key not in duplicates:
+                duplicates[block_key].append(first)
+            duplicates[block_key].append(location)
+
+    # Группы упорядочены по первому появлению блока, как при обходе файлов
+    return {key: duplicates[key] for key in first_seen if key in duplicates}
 
 def main():
     project_root = Path(__file__).parent.parent
+    # Время отчета фиксируется один раз при запуске
+    report_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
 
     print("="*80)
     print("АНАЛИЗ ДУБЛИРОВАНИЯ КОДА")
@@ -90,13 +249,22 @@ def main():
     ui_dir = project_root / "ui"
     calc_dir = project_root / "calculations"
 
+    # Содержимое каталогов читается один раз и используется во всех разделах
+    ui_files = list_py_files(ui_dir)
+    calc_files = list_py_files(calc_dir)
+    ui_file_names = {filepath.name for filepath in ui_files}
+
+    # Каждый файл читается один раз, дальше все анализы работают с памятью
+    scanned_files = [
+        info for info in map(scan_file, ui_files + calc_files)
+        if info is not None
+    ]
+
     all_imports = defaultdict(list)
 
-    for directory in [ui_dir, calc_dir]:
-        for filepath in directory.glob("*.py"):
-            imports = extract_imports(filepath)
-            for imp in imports:
-                all_imports[imp].append(filepath.name)
+    for info in scanned_files:
+        for imp in info.imports:
+            all_imports[imp].append(info.path.name)
 
     # Наиболее часто используемые импорты
     common_imports = {k: v for k, v in all_imports.items() if len(v) > 10}
@@ -110,11 +278,9 @@ def main():
 
     all_methods = defaultdict(list)
 
-    for directory in [ui_dir, calc_dir]:
-        for filepath in directory.glob("*.py"):
-            methods = extract_methods(filepath)
-            for method in methods:
-                all_methods[method].append(filepath.name)
+    for info in scanned_files:
+        for method in info.methods:
+            all_methods[method].append(info.path.name)
 
     # Методы с одинаковыми именами в разных файлах
     duplicate_names = {k: v for k, v in all_methods.items() if len(v) > 1}
@@ -128,14 +294,15 @@ def main():
     print("\n\n3. ПОИСК ПОХОЖИХ БЛОКОВ КОДА (10+ строк)")
     print("="*80)
 
-    duplicates = find_similar_code_blocks(project_root, min_lines=10)
+    min_lines = 10
+    duplicates = find_similar_code_blocks(scanned_files, min_lines=min_lines)
 
     if duplicates:
         print(f"\nНайдено {len(duplicates)} групп дублированного кода:")
         for i, (hash_val, locations) in enumerate(list(duplicates.items())[:10], 1):
             print(f"\n  Группа {i}:")
-            for filepath, line_num, num_lines in locations:
-                print(f"    - {filepath.name}:{line_num} ({num_lines} строк)")
+            for file_index, line_num in locations:
+                print(f"    - {scanned_files[file_index].path.name}:{line_num} ({min_lines} строк)")
     else:
         print("\n✓ Значительного дублирования кода не обнаружено")
 
@@ -144,7 +311,10 @@ def main():
     print("="*80)
 
     # Проверяем категории выбросов
-    category_tabs = list(ui_dir.glob("category_*_tab.py"))
+    category_tabs = [
+        filepath for filepath in ui_files
+        if filepath.name.startswith("category_") and filepath.name.endswith("_tab.py")
+    ]
     print(f"\nНайдено {len(category_tabs)} вкладок категорий выбросов")
 
     # Проверяем вкладки поглощения
@@ -157,12 +327,12 @@ def main():
         "land_conversion_tab.py",
     ]
 
-    existing_absorption = [f for f in absorption_tabs if (ui_dir / f).exists()]
+    existing_absorption = [f for f in absorption_tabs if f in ui_file_names]
     print(f"Найдено {len(existing_absorption)} вкладок поглощения")
 
     # Проверяем базовые классы
     base_classes = ["base_tab.py", "absorption_base_tab.py"]
-    existing_bases = [f for f in base_classes if (ui_dir / f).exists()]
+    existing_bases = [f for f in base_classes if f in ui_file_names]
     print(f"\nБазовые классы: {existing_bases}")
 
     # 5. Проверка использования валидации
@@ -176,14 +346,13 @@ def main():
         "ValidationType": 0,
     }
 
-    for filepath in ui_dir.glob("*.py"):
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                for pattern in validation_patterns:
-                    validation_patterns[pattern] += content.count(pattern)
-        except:
-            pass
+    # Одна альтернатива по всем шаблонам: каждый файл просматривается один раз
+    validation_re = re.compile('|'.join(map(re.escape, validation_patterns)))
+    for info in scanned_files:
+        if info.path.parent != ui_dir:
+            continue
+        for match in validation_re.finditer(info.text):
+            validation_patterns[match.group()] += 1
 
     print("\nИспользование валидации:")
     for pattern, count in sorted(validation_patterns.items(), key=lambda x: x[1], reverse=True):
@@ -232,30 +401,35 @@ def main():
 
     # Сохранение отчета
     report_path = project_root / "docs" / "CODE_DUPLICATION_REPORT.md"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("# Отчет об анализе дублирования кода\n\n")
-        f.write(f"**Дата:** {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-
-        f.write("## Статистика\n\n")
-        f.write(f"- Вкладок категорий: {len(category_tabs)}\n")
-        f.write(f"- Вкладок поглощения: {len(existing_absorption)}\n")
-        f.write(f"- Методов с повторяющимися именами: {len(duplicate_names)}\n")
-        f.write(f"- Групп дублированного кода: {len(duplicates)}\n\n")
-
-        f.write("## Часто используемые импорты\n\n")
-        for imp, files in sorted(common_imports.items(), key=lambda x: len(x[1]), reverse=True)[:15]:
-            f.write(f"- `{imp}` - {len(files)} файлов\n")
-
-        f.write("\n## Методы с повторяющимися именами (топ-15)\n\n")
-        for method, files in sorted(duplicate_names.items(), key=lambda x: len(x[1]), reverse=True)[:15]:
-            f.write(f"- `{method}` - {len(files)} файлов\n")
-
-        f.write("\n## Рекомендации\n\n")
-        if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                f.write(f"{i}. {rec}\n\n")
-        else:
-            f.write("Критичных проблем не обнаружено.\n")
+    # Отчет собирается в памяти и записывается на диск одним вызовом
+    report = io.StringIO()
+    report.write("# Отчет об анализе дублирования кода\n\n")
+    report.write(f"**Дата:** {report_timestamp}\n\n")
+
+    report.write("## Статистика\n\n")
+    report.write(f"- Вкладок категорий: {len(category_tabs)}\n")
+    report.write(f"- Вкладок поглощения: {len(existing_absorption)}\n")
+    report.write(f"- Методов с повторяющимися именами: {len(duplicate_names)}\n")
+    report.write(f"- Групп дублированного кода: {len(duplicates)}\n\n")
+
+    report.write("## Часто используемые импорты\n\n")
+    for imp, files in sorted(common_imports.items(), key=lambda x: len(x[1]), reverse=True)[:15]:
+        report.write(f"- `{imp}` - {len(files)} файлов\n")
+
+    report.write("\n## Методы с повторяющимися именами (топ-15)\n\n")
+    for method, files in sorted(duplicate_names.items(), key=lambda x: len(x[1]), reverse=True)[:15]:
+        report.write(f"- `{method}` - {len(files)} файлов\n")
+
+    report.write("\n## Рекомендации\n\n")
+    if recommendations:
+        for i, rec in enumerate(recommendations, 1):
+            report.write(f"{i}. {rec}\n\n")
+    else:
+        report.write("Критичных проблем не обнаружено.\n")
+
+    report_path.parent.mkdir(exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(report.getvalue())
 
     print(f"\n\n✓ Отчет сохранен в: {report_path}")
 
@@ -1,27 +1,32 @@
 """
 Скрипт для проверки покрытия всех 143 формул в интерфейсе
 """
+import io
 import re
 import os
 import sys
 from pathlib import Path
+from datetime import datetime
 from collections import defaultdict
 
 # Установка кодировки UTF-8 для вывода
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+# Упоминание формулы вида Ф.XX
+FORMULA_REF_PATTERN = re.compile(r'Ф\.(\d+)')
 
 def extract_formulas_from_file(filepath):
     """Извлекает упоминания формул из файла"""
     formulas = set()
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Ищем Ф.XX
-            matches = re.findall(r'Ф\.(\d+)', content)
-            formulas.update(int(m) for m in matches)
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 17) as f:
+            for line in f:
+                # Регулярное выражение запускаем только для строк с литералом
+                if 'Ф.' not in line:
+                    continue
+                formulas.update(int(m) for m in FORMULA_REF_PATTERN.findall(line))
     except Exception as e:
         print(f"Ошибка при чтении {filepath}: {e}")
     return formulas
@@ -29,6 +34,8 @@ def extract_formulas_from_file(filepath):
 def main():
     # Путь к проекту
     project_root = Path(__file__).parent.parent
+    # Время отчета фиксируется один раз при запуске
+    report_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
     ui_dir = project_root / "ui"
 
     # Словарь для отслеживания формул по файлам
@@ -54,10 +61,14 @@ def main():
     print("="*80)
     print()
 
+    # Существующие файлы берем из одного просмотра каталога, а не stat на каждый
+    with os.scandir(ui_dir) as entries:
+        existing_files = {entry.name for entry in entries if entry.is_file()}
+
     # Проверяем каждый файл
     for filename in files_to_check:
         filepath = ui_dir / filename
-        if filepath.exists():
+        if filename in existing_files:
             formulas = extract_formulas_from_file(filepath)
             if formulas:
                 for formula_num in formulas:
@@ -155,37 +166,42 @@ def main():
 
     # Сохранение отчета
     report_path = project_root / "docs" / "FORMULA_COVERAGE_REPORT.md"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("# Отчет о покрытии формул\n\n")
-        f.write(f"**Дата:** {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
-        f.write(f"## Общая статистика\n\n")
-        f.write(f"- Всего формул в стандарте: **143**\n")
-        f.write(f"- Найдено в коде: **{total_found}**\n")
-        f.write(f"- Отсутствует: **{total_missing}**\n")
-        f.write(f"- Общее покрытие: **{total_found/143*100:.1f}%**\n\n")
-
-        f.write("## Покрытие по категориям\n\n")
-        for start, end, name in ranges:
-            found_in_range = [f for f in all_found_formulas if start <= f <= end]
-            expected = list(range(start, end + 1))
-            missing = [f for f in expected if f not in found_in_range]
-            coverage = len(found_in_range) / len(expected) * 100 if expected else 0
-
-            f.write(f"### {name} (Ф.{start}-{end})\n\n")
-            f.write(f"- Покрытие: **{coverage:.1f}%** ({len(found_in_range)}/{len(expected)})\n")
-            if found_in_range:
-                f.write(f"- ✓ Реализованы: {sorted(found_in_range)}\n")
-            if missing:
-                f.write(f"- ✗ Отсутствуют: {missing}\n")
-            f.write("\n")
-
-        f.write("## Отсутствующие формулы\n\n")
-        all_missing = [f for f in range(1, 144) if f not in all_found_formulas]
-        if all_missing:
-            f.write(f"Всего отсутствует: **{len(all_missing)}** формул\n\n")
-            f.write(f"Список: {all_missing}\n")
-        else:
-            f.write("Все формулы реализованы!\n")
+    # Отчет собирается в памяти и записывается на диск одним вызовом
+    report = io.StringIO()
+    report.write("# Отчет о покрытии формул\n\n")
+    report.write(f"**Дата:** {report_timestamp}\n\n")
+    report.write(f"## Общая статистика\n\n")
+    report.write(f"- Всего формул в стандарте: **143**\n")
+    report.write(f"- Найдено в коде: **{total_found}**\n")
+    report.write(f"- Отсутствует: **{total_missing}**\n")
+    report.write(f"- Общее покрытие: **{total_found/143*100:.1f}%**\n\n")
+
+    report.write("## Покрытие по категориям\n\n")
+    for start, end, name in ranges:
+        found_in_range = [f for f in all_found_formulas if start <= f <= end]
+        expected = list(range(start, end + 1))
+        missing = [f for f in expected if f not in found_in_range]
+        coverage = len(found_in_range) / len(expected) * 100 if expected else 0
+
+        report.write(f"### {name} (Ф.{start}-{end})\n\n")
+        report.write(f"- Покрытие: **{coverage:.1f}%** ({len(found_in_range)}/{len(expected)})\n")
+        if found_in_range:
+            report.write(f"- ✓ Реализованы: {sorted(found_in_range)}\n")
+        if missing:
+            report.write(f"- ✗ Отсутствуют: {missing}\n")
+        report.write("\n")
+
+    report.write("## Отсутствующие формулы\n\n")
+    all_missing = [f for f in range(1, 144) if f not in all_found_formulas]
+    if all_missing:
+        report.write(f"Всего отсутствует: **{len(all_missing)}** формул\n\n")
+        report.write(f"Список: {all_missing}\n")
+    else:
+        report.write("Все формулы реализованы!\n")
+
+    report_path.parent.mkdir(exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(report.getvalue())
 
     print(f"\n✓ Отчет сохранен в: {report_path}")
 
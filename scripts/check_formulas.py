@@ -4,8 +4,10 @@
 Скрипт для проверки наличия всех 143 формул из Приказа Минприроды РФ от 27.05.2022 N 371
 """
 
+import io
 import re
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Определение диапазонов формул по документу
@@ -74,30 +76,26 @@ FORMULA_RANGES = {
     }
 }
 
+# Упоминания формул в разных форматах одним проходом:
+# Ф. 123, (Ф. 123), Формула 123, F123 и f123_result
+FORMULA_REF_PATTERN = re.compile(r'(?:Ф\.\s*|Формула\s+|F)(\d+)|f(\d+)_')
+
+@lru_cache(maxsize=None)
 def find_formulas_in_file(filepath):
-    """Ищет упоминания формул в файле"""
+    """Ищет упоминания формул в файле (каждый файл сканируется один раз)"""
     if not os.path.exists(filepath):
-        return set()
+        return frozenset()
 
     formulas_found = set()
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-        # Поиск упоминаний формул в разных форматах
-        patterns = [
-            r'Ф\.\s*(\d+)',  # Ф. 123
-            r'Формула\s+(\d+)',  # Формула 123
-            r'f(\d+)_',  # f123_result
-            r'\(Ф\.\s*(\d+)\)',  # (Ф. 123)
-            r'F(\d+)',  # F123
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, content)
-            formulas_found.update(int(m) for m in matches if m.isdigit())
+    with open(filepath, 'r', encoding='utf-8', buffering=1 << 17) as f:
+        for line in f:
+            for match in FORMULA_REF_PATTERN.finditer(line):
+                number = match.group(1) or match.group(2)
+                if number.isdigit():
+                    formulas_found.add(int(number))
 
-    return formulas_found
+    return frozenset(formulas_found)
 
 def check_all_formulas():
     """Проверяет наличие всех формул в проекте"""
@@ -171,12 +169,17 @@ if __name__ == "__main__":
     found, missing = check_all_formulas()
 
     # Сохранение результатов
-    with open('docs/formula_check_report.txt', 'w', encoding='utf-8') as f:
-        f.write("ОТЧЕТ О ПРОВЕРКЕ ФОРМУЛ\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"Найдено формул: {len(found)}\n")
-        f.write(f"Список найденных: {sorted(found)}\n\n")
-        if missing:
-            f.write(f"Отсутствуют: {sorted(missing)}\n")
+    # Отчет собирается в памяти и записывается на диск одним вызовом
+    report = io.StringIO()
+    report.write("ОТЧЕТ О ПРОВЕРКЕ ФОРМУЛ\n")
+    report.write("=" * 80 + "\n\n")
+    report.write(f"Найдено формул: {len(found)}\n")
+    report.write(f"Список найденных: {sorted(found)}\n\n")
+    if missing:
+        report.write(f"Отсутствуют: {sorted(missing)}\n")
+
+    os.makedirs('docs', exist_ok=True)
+    with open('docs/formula_check_report.txt', 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(report.getvalue())
 
     print(f"\n\nОтчет сохранен в docs/formula_check_report.txt")
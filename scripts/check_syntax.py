@@ -1,20 +1,43 @@
 """
 Проверка синтаксиса всех Python файлов в проекте
 """
+import os
 import sys
 import py_compile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# При меньшем числе файлов запуск пула процессов дороже самой проверки
+PARALLEL_THRESHOLD = 16
+
+# Файлы больше этого размера проверяются, только если начало похоже на код
+MAX_SOURCE_SIZE = 1 << 20
+HEAD_SIZE = 4096
+PYTHON_MARKERS = (b'def ', b'import ', b'class ', b'#!')
+
 # Установка кодировки UTF-8 для вывода
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+def looks_like_python(filepath):
+    """
+    Читает первые 4 КБ файла и отсеивает двоичные файлы и крупные
+    сгенерированные артефакты, не похожие на исходный код.
+    """
+    with open(filepath, 'rb', buffering=0) as f:
+        head = f.read(HEAD_SIZE)
+        size = os.fstat(f.fileno()).st_size
+    if b'\x00' in head:
+        return False
+    if size > MAX_SOURCE_SIZE:
+        return any(marker in head for marker in PYTHON_MARKERS)
+    return True
 
 def check_syntax(filepath):
-    """Проверяет синтаксис Python файла"""
+    """Проверяет синтаксис Python файла (путь передается строкой для пула процессов)"""
     try:
-        py_compile.compile(str(filepath), doraise=True)
+        py_compile.compile(filepath, doraise=True)
         return True, None
     except py_compile.PyCompileError as e:
         return False, str(e)
@@ -30,21 +53,38 @@ def main():
     errors = []
     success_count = 0
 
-    # Проверяем все .py файлы в проекте
+    # Собираем все .py файлы в проекте
+    py_files = []
     for py_file in project_root.rglob("*.py"):
         # Пропускаем __pycache__ и виртуальные окружения
         if '__pycache__' in str(py_file) or 'venv' in str(py_file) or '.venv' in str(py_file):
             continue
+        if not looks_like_python(py_file):
+            print(f"- Пропущен (не похож на исходный код): {py_file.relative_to(project_root)}")
+            continue
+        py_files.append(py_file)
 
-        is_valid, error = check_syntax(py_file)
+    # Компиляция файлов независима - распределяем ее по ядрам процессора
+    paths = [str(py_file) for py_file in py_files]
+    if len(paths) < PARALLEL_THRESHOLD:
+        results = map(check_syntax, paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor()
+        results = executor.map(check_syntax, paths, chunksize=8)
 
-        if is_valid:
-            success_count += 1
-        else:
-            errors.append((py_file, error))
-            print(f"✗ {py_file.relative_to(project_root)}")
-            print(f"  {error}")
-            print()
+    try:
+        for py_file, (is_valid, error) in zip(py_files, results):
+            if is_valid:
+                success_count += 1
+            else:
+                errors.append((py_file, error))
+                print(f"✗ {py_file.relative_to(project_root)}")
+                print(f"  {error}")
+                print()
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("="*80)
     print("РЕЗУЛЬТАТЫ")
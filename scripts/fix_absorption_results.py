@@ -6,6 +6,34 @@ import re
 from pathlib import Path
 
 
+# Подписи результатов по номерам формул
+FORMULA_LABELS = {
+    2: 'ΔC биомассы',
+    3: 'C древостоя',
+    4: 'C подроста',
+    5: 'C почвы',
+    6: 'Выбросы от пожара',
+    7: 'CO2 от осушения',
+    8: 'N2O от осушения',
+    9: 'CH4 от осушения',
+    10: 'C_FUEL',
+    11: 'CO2 из ΔC',
+    12: 'CO2-экв',
+}
+
+# f"<подпись> (Ф. X): -> f"[Ф. X] <подпись>:
+RESULT_LABELS = {
+    f'f"{label} (Ф. {number}):': f'f"[Ф. {number}] {label}:'
+    for number, label in FORMULA_LABELS.items()
+}
+RESULT_LABEL_RE = re.compile('|'.join(map(re.escape, RESULT_LABELS)))
+
+
+def _relabel_result(match):
+    """Возвращает новую подпись результата для найденной старой."""
+    return RESULT_LABELS[match.group()]
+
+
 def fix_result_display(file_path):
     """Заменяет self.result_text.setText на self._append_result."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -22,24 +50,9 @@ def fix_result_display(file_path):
     # Паттерн: self.result_text.setText(...)
     content = content.replace('self.result_text.setText(', 'self._append_result(')
 
-    # Также заменяем форматирование результатов для единого стиля
-    # Заменяем просто имя формулы на [Ф. X]
-    patterns = [
-        (r'f"ΔC биомассы \(Ф\. 2\):', r'f"[Ф. 2] ΔC биомассы:'),
-        (r'f"C древостоя \(Ф\. 3\):', r'f"[Ф. 3] C древостоя:'),
-        (r'f"C подроста \(Ф\. 4\):', r'f"[Ф. 4] C подроста:'),
-        (r'f"C почвы \(Ф\. 5\):', r'f"[Ф. 5] C почвы:'),
-        (r'f"Выбросы от пожара \(Ф\. 6\):', r'f"[Ф. 6] Выбросы от пожара:'),
-        (r'f"CO2 от осушения \(Ф\. 7\):', r'f"[Ф. 7] CO2 от осушения:'),
-        (r'f"N2O от осушения \(Ф\. 8\):', r'f"[Ф. 8] N2O от осушения:'),
-        (r'f"CH4 от осушения \(Ф\. 9\):', r'f"[Ф. 9] CH4 от осушения:'),
-        (r'f"C_FUEL \(Ф\. 10\):', r'f"[Ф. 10] C_FUEL:'),
-        (r'f"CO2 из ΔC \(Ф\. 11\):', r'f"[Ф. 11] CO2 из ΔC:'),
-        (r'f"CO2-экв \(Ф\. 12\):', r'f"[Ф. 12] CO2-экв:'),
-    ]
-
-    for old_pattern, new_pattern in patterns:
-        content = re.sub(old_pattern, new_pattern, content)
+    # Также заменяем форматирование результатов для единого стиля:
+    # имя формулы переносится в префикс [Ф. X] за один проход по тексту
+    content = RESULT_LABEL_RE.sub(_relabel_result, content)
 
     # Сохраняем файл
     with open(file_path, 'w', encoding='utf-8') as f:
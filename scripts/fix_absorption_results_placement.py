@@ -2,142 +2,141 @@
 Скрипт для исправления расположения результатов в absorption tabs.
 Добавляет QLabel результаты после каждой кнопки "Рассчитать" и удаляет нижний result_text.
 """
+import ast
+import hashlib
+import mmap
 import re
 import os
-
-def fix_forest_restoration_tab():
-    """Исправляет forest_restoration_tab.py"""
-    file_path = "ui/forest_restoration_tab.py"
-
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Удаляем блок result_text и кнопку очистки (строки 191-198)
-    content = re.sub(
-        r'\n\s+# --- Результаты ---\n\s+self\.result_text = QTextEdit\(\).*?\n\s+layout\.addWidget\(self\.result_text\)\n\s+\n\s+# Кнопка очистки результатов\n\s+clear_results_btn = QPushButton\("🗑 Очистить результаты"\)\n\s+clear_results_btn\.clicked\.connect\(lambda: self\.result_text\.clear\(\)\)\n\s+layout\.addWidget\(clear_results_btn\)\n',
-        '\n',
-        content
-    )
-
-    # Добавляем результаты после каждой кнопки расчета
-
-    # Ф.1
-    content = re.sub(
-        r'(calc_f1_btn = QPushButton\("Рассчитать ΔC общее \(Ф\. 1\)"\); calc_f1_btn\.clicked\.connect\(self\._calculate_f1\)\n\s+carbon_layout\.addRow\(calc_f1_btn\))',
-        r'\1\n        self.f1_result = QLabel("—"); self.f1_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f1_result.setWordWrap(True)\n        carbon_layout.addRow("Результат:", self.f1_result)',
-        content
-    )
-
-    # Ф.2
-    content = re.sub(
-        r'(calc_f2_btn = QPushButton\("Рассчитать ΔC биомассы \(Ф\. 2\)"\); calc_f2_btn\.clicked\.connect\(self\._calculate_f2\)\n\s+layout_f2\.addRow\(calc_f2_btn\))',
-        r'\1\n        self.f2_result = QLabel("—"); self.f2_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f2_result.setWordWrap(True)\n        layout_f2.addRow("Результат:", self.f2_result)',
-        content
+from pathlib import Path
+
+# Подписи результата, отличающиеся от стандартной "Результат:"
+_RESULT_CAPTIONS = {n: f"Результат Ф.{n}:" for n in (7, 8, 9, 11, 12)}
+
+# Имя кнопки расчета формулы: calc_f<номер>_btn
+_BUTTON_NAME_RE = re.compile(r'calc_f(\d+)_btn')
+_RESULT_ATTR_RE = re.compile(r'f(\d+)_result')
+
+# Блок result_text с кнопкой очистки внизу вкладки. Каждая строка шаблона
+# ограничена символом перевода строки ([ \t] вместо \s, [^\n]* вместо .*?),
+# поэтому поиск линеен и не перебирает варианты через границы строк
+_RE_CLEANUP = re.compile(
+    r'\n[ \t]+# --- Результаты ---'
+    r'\n[ \t]+self\.result_text = QTextEdit\(\)[^\n]*'
+    r'\n[ \t]+layout\.addWidget\(self\.result_text\)'
+    r'\n[ \t]*'
+    r'\n[ \t]+# Кнопка очистки результатов'
+    r'\n[ \t]+clear_results_btn = QPushButton\("🗑 Очистить результаты"\)'
+    r'\n[ \t]+clear_results_btn\.clicked\.connect\(lambda: self\.result_text\.clear\(\)\)'
+    r'\n[ \t]+layout\.addWidget\(clear_results_btn\)\n'
+)
+
+
+def _layout_call(node):
+    """Для выражения вида layout.method(arg) возвращает (layout, method, arg)"""
+    if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)):
+        return None
+    call = node.value
+    if not (isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name)):
+        return None
+    if len(call.args) != 1 or not isinstance(call.args[0], ast.Name):
+        return None
+    return call.func.value.id, call.func.attr, call.args[0].id
+
+
+def _result_insertions(tree):
+    """
+    Находит места вставки QLabel результатов по дереву разбора.
+
+    Результат вставляется после строки, добавляющей кнопку calc_fN_btn в
+    форму (layout.addRow(calc_fN_btn)), либо после добавления в форму
+    горизонтального layout с этой кнопкой (Ф.10). Формулы, для которых
+    self.fN_result уже создается, пропускаются - повторный запуск ничего
+    не меняет.
+
+    Returns:
+        Список (номер строки, номер формулы, layout формы, через addLayout)
+    """
+    existing = set()
+    rows = {}
+    widget_parent = {}
+    layout_added = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if (isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name)
+                        and target.value.id == 'self'):
+                    match = _RESULT_ATTR_RE.fullmatch(target.attr)
+                    if match:
+                        existing.add(int(match.group(1)))
+            continue
+
+        call = _layout_call(node)
+        if call is None:
+            continue
+        layout, method, arg = call
+        match = _BUTTON_NAME_RE.fullmatch(arg)
+        if match and method == 'addRow':
+            rows[int(match.group(1))] = (node.end_lineno, layout, False)
+        elif match and method == 'addWidget':
+            widget_parent[int(match.group(1))] = layout
+        elif method == 'addLayout':
+            layout_added[arg] = (node.end_lineno, layout)
+
+    for n, inner in widget_parent.items():
+        if n not in rows and inner in layout_added:
+            end_lineno, layout = layout_added[inner]
+            rows[n] = (end_lineno, layout, True)
+
+    return [(end_lineno, n, layout, nested)
+            for n, (end_lineno, layout, nested) in rows.items()
+            if n not in existing]
+
+
+def _result_snippet(n, layout, nested, indent):
+    """Две строки кода: создание QLabel результата формулы n и его размещение в layout"""
+    caption = _RESULT_CAPTIONS.get(n, "Результат:")
+    if nested:
+        add_result = f'{layout}.addWidget(QLabel("{caption}")); {layout}.addWidget(self.f{n}_result)'
+    else:
+        add_result = f'{layout}.addRow("{caption}", self.f{n}_result)'
+    return (
+        f'{indent}self.f{n}_result = QLabel("—"); '
+        f'self.f{n}_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); '
+        f'self.f{n}_result.setWordWrap(True)\n'
+        f'{indent}{add_result}\n'
     )
 
-    # Ф.3
-    content = re.sub(
-        r'(calc_f3_btn = QPushButton\("Рассчитать C древостоя \(Ф\. 3\)"\); calc_f3_btn\.clicked\.connect\(self\._calculate_f3\)\n\s+layout_f3\.addRow\(calc_f3_btn\))',
-        r'\1\n        self.f3_result = QLabel("—"); self.f3_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f3_result.setWordWrap(True)\n        layout_f3.addRow("Результат:", self.f3_result)',
-        content
-    )
-
-    # Ф.4
-    content = re.sub(
-        r'(calc_f4_btn = QPushButton\("Рассчитать C подроста \(Ф\. 4\)"\); calc_f4_btn\.clicked\.connect\(self\._calculate_f4\)\n\s+layout_f4\.addRow\(calc_f4_btn\))',
-        r'\1\n        self.f4_result = QLabel("—"); self.f4_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f4_result.setWordWrap(True)\n        layout_f4.addRow("Результат:", self.f4_result)',
-        content
-    )
 
-    # Ф.5
-    content = re.sub(
-        r'(calc_f5_btn = QPushButton\("Рассчитать C почвы \(Ф\. 5\)"\); calc_f5_btn\.clicked\.connect\(self\._calculate_f5\)\n\s+layout_f5\.addRow\(calc_f5_btn\))',
-        r'\1\n        self.f5_result = QLabel("—"); self.f5_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f5_result.setWordWrap(True)\n        layout_f5.addRow("Результат:", self.f5_result)',
-        content
-    )
+def _insert_result_labels(content):
+    """Добавляет QLabel результата после каждой кнопки расчета (один разбор файла)"""
+    insertions = _result_insertions(ast.parse(content))
+    if not insertions:
+        return content
 
-    # Ф.6
-    content = re.sub(
-        r'(calc_f6_btn = QPushButton\("Рассчитать выбросы от пожара \(Ф\. 6\)"\); calc_f6_btn\.clicked\.connect\(self\._calculate_f6\)\n\s+layout_f6\.addRow\(calc_f6_btn\))',
-        r'\1\n        self.f6_result = QLabel("—"); self.f6_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f6_result.setWordWrap(True)\n        layout_f6.addRow("Результат:", self.f6_result)',
-        content
-    )
+    lines = content.splitlines(keepends=True)
+    # Вставка с конца файла не сдвигает номера строк еще не обработанных мест
+    for end_lineno, n, layout, nested in sorted(insertions, reverse=True):
+        anchor = lines[end_lineno - 1]
+        indent = anchor[:len(anchor) - len(anchor.lstrip())]
+        lines.insert(end_lineno, _result_snippet(n, layout, nested, indent))
+    return ''.join(lines)
 
-    # Ф.7
-    content = re.sub(
-        r'(calc_f7_btn = QPushButton\("Рассчитать CO2 \(Ф\. 7\)"\); calc_f7_btn\.clicked\.connect\(self\._calculate_f7\)\n\s+drain_layout\.addRow\(calc_f7_btn\))',
-        r'\1\n        self.f7_result = QLabel("—"); self.f7_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f7_result.setWordWrap(True)\n        drain_layout.addRow("Результат:", self.f7_result)',
-        content
-    )
 
-    # Ф.8
-    content = re.sub(
-        r'(calc_f8_btn = QPushButton\("Рассчитать N2O \(Ф\. 8\)"\); calc_f8_btn\.clicked\.connect\(self\._calculate_f8\)\n\s+drain_layout\.addRow\(calc_f8_btn\))',
-        r'\1\n        self.f8_result = QLabel("—"); self.f8_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f8_result.setWordWrap(True)\n        drain_layout.addRow("Результат:", self.f8_result)',
-        content
-    )
+# Отпечаток файла вкладки после последнего исправления
+_HASH_FILE = Path(__file__).with_name('.fix_forest_restoration.hash')
 
-    # Ф.9
-    content = re.sub(
-        r'(calc_f9_btn = QPushButton\("Рассчитать CH4 \(Ф\. 9\)"\); calc_f9_btn\.clicked\.connect\(self\._calculate_f9\)\n\s+drain_layout\.addRow\(calc_f9_btn\))',
-        r'\1\n        self.f9_result = QLabel("—"); self.f9_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f9_result.setWordWrap(True)\n        drain_layout.addRow("Результат:", self.f9_result)',
-        content
-    )
 
-    # Ф.10
-    content = re.sub(
-        r'(calc_f10_btn = QPushButton\("Рассчитать C_FUEL \(Ф\. 10\)"\)\n\s+calc_f10_btn\.clicked\.connect\(self\._calculate_f10\)\n\s+fuel_btn_layout\.addWidget\(add_fuel_btn\)\n\s+fuel_btn_layout\.addWidget\(remove_fuel_btn\)\n\s+fuel_btn_layout\.addWidget\(calc_f10_btn\)\n\s+fuel_layout\.addLayout\(fuel_btn_layout\))',
-        r'\1\n        self.f10_result = QLabel("—"); self.f10_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f10_result.setWordWrap(True)\n        fuel_layout.addWidget(QLabel("Результат:")); fuel_layout.addWidget(self.f10_result)',
-        content
-    )
+def _file_digest(data):
+    """BLAKE2-отпечаток содержимого файла (bytes или mmap)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
-    # Ф.11
-    content = re.sub(
-        r'(calc_f11_btn = QPushButton\("Перевести ΔC в CO2 \(Ф\. 11\)"\); calc_f11_btn\.clicked\.connect\(self\._calculate_f11\))',
-        r'\1\n        self.f11_result = QLabel("—"); self.f11_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f11_result.setWordWrap(True)\n        convert_layout.addRow(calc_f11_btn)\n        convert_layout.addRow("Результат Ф.11:", self.f11_result)',
-        content
-    )
-    # Убираем двойное добавление кнопки
-    content = re.sub(
-        r'(self\.f11_result\.setWordWrap\(True\)\n\s+convert_layout\.addRow\(calc_f11_btn\)\n\s+convert_layout\.addRow\("Результат Ф\.11:", self\.f11_result\))\n\s+calc_f12_btn',
-        r'\1\n        calc_f12_btn',
-        content
-    )
 
-    # Ф.12
-    content = re.sub(
-        r'(calc_f12_btn = QPushButton\("Перевести в CO2-экв \(Ф\. 12\)"\); calc_f12_btn\.clicked\.connect\(self\._calculate_f12\))',
-        r'\1\n        self.f12_result = QLabel("—"); self.f12_result.setStyleSheet("color: green; font-weight: bold; padding: 5px;"); self.f12_result.setWordWrap(True)\n        convert_layout.addRow(calc_f12_btn)\n        convert_layout.addRow("Результат Ф.12:", self.f12_result)',
-        content
-    )
-    # Убираем двойное добавление кнопок
-    content = re.sub(
-        r'(self\.f12_result\.setWordWrap\(True\)\n\s+convert_layout\.addRow\(calc_f12_btn\)\n\s+convert_layout\.addRow\("Результат Ф\.12:", self\.f12_result\))\n\s+convert_layout\.addRow\(calc_f11_btn\)\n\s+convert_layout\.addRow\(calc_f12_btn\)',
-        r'\1',
-        content
-    )
+# Строка начала раздела методов расчета (вместе с отступом) в файле вкладки
+_RE_METHODS_START = re.compile(rb'^[ \t]*def _calculate_f1\(self\):', re.MULTILINE)
 
-    # Теперь обновляем методы расчета, заменяя _append_result на установку текста в label
-    # Читаем методы
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    # Найдем где начинаются методы расчета
-    method_start = None
-    for i, line in enumerate(lines):
-        if 'def _calculate_f1(self):' in line:
-            method_start = i
-            break
-
-    # Заменим весь раздел методов
-    if method_start:
-        # Сохраняем все до методов
-        before_methods = ''.join(lines[:method_start])
-
-        # Записываем новый файл с обновленными методами
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content[:content.find('def _calculate_f1(self):')])
-            f.write('''    def _calculate_f1(self):
+# Новый раздел методов расчета: результаты выводятся в QLabel под кнопками
+_NEW_METHODS_BLOCK = '''    def _calculate_f1(self):
         try:
             biomass = get_float(self.f1_biomass, "ΔC биомасса")
             deadwood = get_float(self.f1_deadwood, "ΔC мертвая древесина")
@@ -323,7 +322,41 @@ def fix_forest_restoration_tab():
 
         data['details'] = details
         return data
-''')
+'''
+
+def fix_forest_restoration_tab():
+    """Исправляет forest_restoration_tab.py"""
+    file_path = "ui/forest_restoration_tab.py"
+
+    # Раздел методов расчета заменяется целиком, поэтому декодируется только
+    # часть файла до него: начало методов ищется в отображенных байтах
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Файл не менялся с прошлого исправления - повторно не обрабатываем
+        if _HASH_FILE.exists() and _HASH_FILE.read_text(encoding='ascii').strip() == _file_digest(mm):
+            print("✅ forest_restoration_tab.py уже исправлен")
+            return
+
+        # Один проход поиска сразу дает начало строки: отступ метода уже
+        # есть в _NEW_METHODS_BLOCK
+        methods_start = _RE_METHODS_START.search(mm)
+        if methods_start is None:
+            print("⚠ forest_restoration_tab.py: методы расчета не найдены")
+            return
+        content = mm[:methods_start.start()].decode('utf-8')
+
+    # Удаляем блок result_text и кнопку очистки
+    if '# --- Результаты ---' in content:
+        content = _RE_CLEANUP.sub('\n', content)
+
+    # Добавляем результаты после каждой кнопки расчета
+    content = _insert_result_labels(content)
+
+    # Новый файл собирается из частей и записывается одним вызовом write
+    parts = [content, _NEW_METHODS_BLOCK]
+    data = ''.join(parts).encode('utf-8')
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        f.write(data)
+    _HASH_FILE.write_text(_file_digest(data), encoding='ascii')
 
     print("✅ forest_restoration_tab.py исправлен")
 
@@ -7,24 +7,48 @@ import re
 with open('ui/land_conversion_tab.py', 'r', encoding='utf-8') as f:
     content = f.read()
 
-# Replacements for _append_result -> setText
-replacements = [
-    (r'self\._append_result\((f"[^"]*Изменение запасов C в результате конверсии[^"]*")\)', r'self.f91_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Выбросы CO2 от осушения[^"]*")\)', r'self.f92_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Выбросы N2O от осушения[^"]*)\)', r'self.f93_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Выбросы CH4 от осушения[^"]*)\)', r'self.f94_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Выбросы от пожара[^"]*)\)', r'self.f95_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*ΔC на кормовых угодьях[^"]*)\)', r'self.f96_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*C из растений[^"]*)\)', r'self.f97_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Потери C от эрозии[^"]*)\)', r'self.f99_result.setText(\1)'),
-    (r'self\._append_result\((f"[^"]*Вынос C с урожаем[^"]*)\)', r'self.f100_result.setText(\1)'),
+# Label text fragment -> result label attribute (checked in this order)
+RESULT_TARGETS = [
+    ('Изменение запасов C в результате конверсии', 'f91_result'),
+    ('Выбросы CO2 от осушения', 'f92_result'),
+    ('Выбросы N2O от осушения', 'f93_result'),
+    ('Выбросы CH4 от осушения', 'f94_result'),
+    ('Выбросы от пожара', 'f95_result'),
+    ('ΔC на кормовых угодьях', 'f96_result'),
+    ('C из растений', 'f97_result'),
+    ('Потери C от эрозии', 'f99_result'),
+    ('Вынос C с урожаем', 'f100_result'),
 ]
 
-for pattern, replacement in replacements:
-    content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+# One pattern for every _append_result(f"...") call
+APPEND_RESULT_RE = re.compile(r'self\._append_result\(\s*(f"[^"]*")\s*\)')
 
-# Write back
-with open('ui/land_conversion_tab.py', 'w', encoding='utf-8') as f:
-    f.write(content)
 
-print(f"Completed replacements")
+def _result_target(text):
+    """Result label attribute for the f-string text, or None"""
+    for fragment, attr in RESULT_TARGETS:
+        if fragment in text:
+            return attr
+    return None
+
+
+# Single walk over the matches; unchanged text between them is copied as is
+parts = []
+position = 0
+replaced = 0
+for match in APPEND_RESULT_RE.finditer(content):
+    attr = _result_target(match.group(1))
+    if attr is None:
+        continue
+    parts.append(content[position:match.start()])
+    parts.append(f'self.{attr}.setText({match.group(1)})')
+    position = match.end()
+    replaced += 1
+
+if replaced:
+    parts.append(content[position:])
+    # Write back
+    with open('ui/land_conversion_tab.py', 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+print(f"Completed replacements: {replaced}")
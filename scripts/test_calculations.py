@@ -1,24 +1,60 @@
 """
 Скрипт для тестирования работоспособности расчетов
 """
+import math
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
 
 # Установка кодировки UTF-8 для вывода
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # Добавляем корень проекта в путь
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-def test_forest_restoration():
-    """Тест расчетов лесовосстановления"""
-    from calculations.absorption_forest_restoration import ForestRestorationCalculator
+from calculations.absorption_forest_restoration import ForestRestorationCalculator
+from calculations.absorption_permanent_forest import PermanentForestCalculator
+from calculations.absorption_agricultural import LandConversionCalculator
+from config import CARBON_TO_CO2_FACTOR
+
+
+# Калькуляторы создаются один раз и используются всеми тестами
+@lru_cache(maxsize=None)
+def _forest():
+    return ForestRestorationCalculator()
+
+@lru_cache(maxsize=None)
+def _permanent():
+    return PermanentForestCalculator()
+
+@lru_cache(maxsize=None)
+def _land():
+    return LandConversionCalculator()
 
-    calc = ForestRestorationCalculator()
+# Допустимое относительное отклонение для нецелых ожидаемых значений;
+# целые ожидаемые значения сравниваются точно
+REL_TOL = 1e-4
+
+# Строка отчета по одной проверке
+ROW_TEMPLATE = "{0}: {1:.4f} {3} (ожидается {2:.4f})"
+
+# Расчеты каждого теста возвращают строки (метка, результат, ожидается, единицы);
+# main проверяет и выводит их одним проходом, test_* - проверяют под pytest
+
+def _is_correct(got, expected):
+    """Целые ожидаемые значения сравниваются точно, остальные - с REL_TOL"""
+    if isinstance(expected, int):
+        return got == expected
+    return math.isclose(got, expected, rel_tol=REL_TOL)
+
+def _forest_restoration_rows():
+    """Тест расчетов лесовосстановления"""
+    rows = []
+    calc = _forest()
 
     # Тест Ф.1 - Суммарное изменение запасов углерода
     result_f1 = calc.calculate_carbon_stock_change(
@@ -28,8 +64,7 @@ def test_forest_restoration():
         soil_change=20          # т C/год
     )
     expected_f1 = 100 + 10 + 5 + 20
-    print(f"Ф.1 Изменение запасов C: {result_f1:.4f} т C/год (ожидается {expected_f1:.4f})")
-    assert abs(result_f1 - expected_f1) < 0.01, "Ф.1 расчет некорректен!"
+    rows.append(("Ф.1 Изменение запасов C", result_f1, expected_f1, "т C/год"))
 
     # Тест Ф.2 - Изменение биомассы
     result_f2 = calc.calculate_biomass_change(
@@ -38,145 +73,171 @@ def test_forest_restoration():
         area=100,           # га
         period_years=10     # лет
     )
-    expected_f2 = (50 - 30) * 100 / 10
-    print(f"Ф.2 Изменение биомассы: {result_f2:.4f} т C/год (ожидается {expected_f2:.4f})")
-    assert abs(result_f2 - expected_f2) < 0.01, "Ф.2 расчет некорректен!"
+    expected_f2 = 200  # (50 - 30) * 100 / 10
+    rows.append(("Ф.2 Изменение биомассы", result_f2, expected_f2, "т C/год"))
 
-    # Тест Ф.11 - Конверсия углерода в CO2
-    result_f11 = calc.carbon_to_co2_conversion(100)  # 100 т C
-    expected_f11 = 100 * (44/12)
-    print(f"Ф.11 C->CO2: {result_f11:.4f} т CO2 (ожидается {expected_f11:.4f})")
-    assert abs(result_f11 - expected_f11) < 0.01, "Ф.11 расчет некорректен!"
+    # Тест Ф.11 - Конверсия углерода в CO2 (прирост запасов - поглощение)
+    result_f11 = calc.carbon_to_co2(100)  # 100 т C
+    expected_f11 = -100 * CARBON_TO_CO2_FACTOR
+    rows.append(("Ф.11 C->CO2", result_f11, expected_f11, "т CO2"))
 
-    return True
+    return rows
 
-def test_permanent_forest():
+def _permanent_forest_rows():
     """Тест расчетов постоянных лесов"""
-    from calculations.absorption_permanent_forest import PermanentForestCalculator
+    rows = []
+    calc = _permanent()
 
-    calc = PermanentForestCalculator()
+    # Тест Ф.27 - Запас углерода в биомассе древостоев
+    result_f27 = calc.calculate_biomass_carbon_stock(
+        volume=200,             # м³
+        conversion_factor=0.25  # KP
+    )
+    expected_f27 = 50  # 200 * 0.25
+    rows.append(("Ф.27 Запас C в биомассе", result_f27, expected_f27, "т C"))
 
-    # Тест Ф.27 - Общее изменение запасов углерода
-    result_f27 = calc.calculate_total_carbon_stock_change(
-        biomass_change=100,     # т C/год
-        deadwood_change=10,     # т C/год
-        litter_change=5,        # т C/год
-        soil_change=20          # т C/год
+    # Тест Ф.28 - Средний запас углерода на гектар
+    result_f28 = calc.calculate_mean_carbon_per_hectare(
+        carbon_stock=1000,  # т C
+        area=10             # га
     )
-    expected_f27 = 100 + 10 + 5 + 20
-    print(f"Ф.27 Общее изменение C: {result_f27:.4f} т C/год (ожидается {expected_f27:.4f})")
-    assert abs(result_f27 - expected_f27) < 0.01, "Ф.27 расчет некорректен!"
-
-    # Тест Ф.28 - Изменение запасов углерода в биомассе
-    result_f28 = calc.calculate_carbon_stock_change_biomass(
-        carbon_after=1000,  # т C
-        carbon_before=800,  # т C
-        area=10,            # га
-        period_years=5      # лет
+    expected_f28 = 100  # 1000 / 10
+    rows.append(("Ф.28 Средний запас C", result_f28, expected_f28, "т C/га"))
+
+    # Тест Ф.55 - Суммарный бюджет углерода
+    result_f55 = calc.calculate_total_budget(
+        biomass_budget=100,     # т C/год
+        deadwood_budget=10,     # т C/год
+        litter_budget=5,        # т C/год
+        soil_budget=20          # т C/год
     )
-    expected_f28 = (1000 - 800) / 10 / 5
-    print(f"Ф.28 Изменение запасов C: {result_f28:.4f} т C/га/год (ожидается {expected_f28:.4f})")
-    assert abs(result_f28 - expected_f28) < 0.01, "Ф.28 расчет некорректен!"
+    expected_f55 = 100 + 10 + 5 + 20
+    rows.append(("Ф.55 Бюджет углерода", result_f55, expected_f55, "т C/год"))
 
-    return True
+    return rows
 
-def test_land_conversion():
+def _land_conversion_rows():
     """Тест расчетов конверсии земель"""
-    from calculations.land_conversion import LandConversionCalculator
-
-    calc = LandConversionCalculator()
+    rows = []
+    calc = _land()
 
     # Тест Ф.91 - Изменение запасов углерода при конверсии
-    result_f91 = calc.calculate_carbon_stock_change_conversion(
-        c_after_sum=500,   # т C
-        c_before_sum=800,  # т C
-        area=20,           # га
-        period=10          # лет
+    result_f91 = calc.calculate_conversion_carbon_change(
+        carbon_after=[300, 200],    # т C/га по пулам
+        carbon_before=[500, 300],   # т C/га по пулам
+        conversion_area=20,         # га
+        period=10                   # лет
     )
-    expected_f91 = (500 - 800) / 20 / 10
-    print(f"Ф.91 Изменение C конверсия: {result_f91:.4f} т C/га/год (ожидается {expected_f91:.4f})")
-    assert abs(result_f91 - expected_f91) < 0.01, "Ф.91 расчет некорректен!"
-
-    # Тест Ф.96 - Изменение запасов углерода в минеральных почвах
-    result_f96 = calc.calculate_mineral_soil_carbon_change(
-        c_fert=10,    # т C/год
-        c_plant=100,  # т C/год
-        c_manure=20,  # т C/год
-        c_resp=30,    # т C/год
-        c_erosion=15, # т C/год
-        c_hay=25      # т C/год
+    expected_f91 = -600  # (500 - 800) * 20 / 10
+    rows.append(("Ф.91 Изменение C конверсия", result_f91, expected_f91, "т C/год"))
+
+    # Тест Ф.92 - Выбросы CO2 от осушенных почв переведенных земель
+    result_f92 = calc.calculate_converted_land_co2(
+        area=10,  # га
+        ef=5.9    # т C/га/год
     )
-    expected_f96 = 10 + 100 + 20 - 30 - 15 - 25
-    print(f"Ф.96 Изменение C минер.почв: {result_f96:.4f} т C/год (ожидается {expected_f96:.4f})")
-    assert abs(result_f96 - expected_f96) < 0.01, "Ф.96 расчет некорректен!"
+    expected_f92 = 10 * 5.9 * CARBON_TO_CO2_FACTOR
+    rows.append(("Ф.92 CO2 осушенных почв", result_f92, expected_f92, "т CO2/год"))
 
-    return True
+    return rows
 
-def test_gwp_conversion():
+def _gwp_conversion_rows():
     """Тест конверсии в CO2-эквивалент"""
-    from calculations.forest_restoration import ForestRestorationCalculator
-
-    calc = ForestRestorationCalculator()
+    rows = []
+    calc = _forest()
 
     # Тест конверсии CH4
-    result_ch4 = calc.ghg_to_co2_equivalent(10, "CH4")  # 10 т CH4
+    result_ch4 = calc.to_co2_equivalent(10, "CH4")  # 10 т CH4
     expected_ch4 = 10 * 28  # GWP для CH4 = 28
-    print(f"Конверсия CH4: {result_ch4:.4f} т CO2-экв (ожидается {expected_ch4:.4f})")
-    assert abs(result_ch4 - expected_ch4) < 0.01, "Конверсия CH4 некорректна!"
+    rows.append(("Конверсия CH4", result_ch4, expected_ch4, "т CO2-экв"))
 
     # Тест конверсии N2O
-    result_n2o = calc.ghg_to_co2_equivalent(5, "N2O")  # 5 т N2O
+    result_n2o = calc.to_co2_equivalent(5, "N2O")  # 5 т N2O
     expected_n2o = 5 * 265  # GWP для N2O = 265
-    print(f"Конверсия N2O: {result_n2o:.4f} т CO2-экв (ожидается {expected_n2o:.4f})")
-    assert abs(result_n2o - expected_n2o) < 0.01, "Конверсия N2O некорректна!"
+    rows.append(("Конверсия N2O", result_n2o, expected_n2o, "т CO2-экв"))
+
+    return rows
+
+def _assert_rows(rows):
+    """Проверяет строки одного теста: под pytest неверное значение - ошибка"""
+    wrong = [(label, got, expected) for label, got, expected, _ in rows
+             if not _is_correct(got, expected)]
+    assert not wrong, f"Расчет некорректен: {wrong}"
+
+def test_forest_restoration():
+    """Тест расчетов лесовосстановления"""
+    _assert_rows(_forest_restoration_rows())
+
+def test_permanent_forest():
+    """Тест расчетов постоянных лесов"""
+    _assert_rows(_permanent_forest_rows())
+
+def test_land_conversion():
+    """Тест расчетов конверсии земель"""
+    _assert_rows(_land_conversion_rows())
 
-    return True
+def test_gwp_conversion():
+    """Тест конверсии в CO2-эквивалент"""
+    _assert_rows(_gwp_conversion_rows())
 
 def main():
-    print("="*80)
-    print("ТЕСТИРОВАНИЕ РАБОТОСПОСОБНОСТИ РАСЧЕТОВ")
-    print("="*80)
-    print()
+    # Весь вывод накапливается в lines и записывается одним вызовом
+    lines = [
+        "="*80,
+        "ТЕСТИРОВАНИЕ РАБОТОСПОСОБНОСТИ РАСЧЕТОВ",
+        "="*80,
+        "",
+    ]
 
     tests = [
-        ("Лесовосстановление", test_forest_restoration),
-        ("Постоянные леса", test_permanent_forest),
-        ("Конверсия земель", test_land_conversion),
-        ("Конверсия GWP", test_gwp_conversion),
+        ("Лесовосстановление", _forest_restoration_rows),
+        ("Постоянные леса", _permanent_forest_rows),
+        ("Конверсия земель", _land_conversion_rows),
+        ("Конверсия GWP", _gwp_conversion_rows),
     ]
 
     passed = 0
     failed = 0
 
     for test_name, test_func in tests:
-        print(f"\n--- Тест: {test_name} ---")
+        lines.append(f"\n--- Тест: {test_name} ---")
         try:
-            result = test_func()
-            if result:
-                print(f"✓ {test_name}: PASSED")
-                passed += 1
-            else:
-                print(f"✗ {test_name}: FAILED")
-                failed += 1
+            rows = test_func()
         except Exception as e:
-            print(f"✗ {test_name}: ERROR - {e}")
-            import traceback
-            traceback.print_exc()
+            lines.append(f"✗ {test_name}: ERROR - {e}")
+            lines.append(traceback.format_exc().rstrip())
             failed += 1
+            continue
 
-    print()
-    print("="*80)
-    print("РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ")
-    print("="*80)
-    print(f"Успешно: {passed}/{len(tests)}")
-    print(f"Провалено: {failed}/{len(tests)}")
+        lines.extend(ROW_TEMPLATE.format(*row) for row in rows)
+        wrong = [label for label, got, expected, _ in rows if not _is_correct(got, expected)]
+        lines.extend(f"  {label}: расчет некорректен!" for label in wrong)
+
+        if not wrong:
+            lines.append(f"✓ {test_name}: PASSED")
+            passed += 1
+        else:
+            lines.append(f"✗ {test_name}: FAILED")
+            failed += 1
+
+    lines += [
+        "",
+        "="*80,
+        "РЕЗУЛЬТАТЫ ТЕСТИРОВАНИЯ",
+        "="*80,
+        f"Успешно: {passed}/{len(tests)}",
+        f"Провалено: {failed}/{len(tests)}",
+    ]
 
     if failed == 0:
-        print("\n✓ Все расчеты работают корректно!")
-        return 0
+        lines.append("\n✓ Все расчеты работают корректно!")
+        exit_code = 0
     else:
-        print(f"\n✗ Обнаружены проблемы в {failed} тестах")
-        return 1
+        lines.append(f"\n✗ Обнаружены проблемы в {failed} тестах")
+        exit_code = 1
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
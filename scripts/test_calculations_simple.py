@@ -1,106 +1,124 @@
 """
 Простая проверка работоспособности расчетов
 """
+import importlib
+import io
 import sys
+import traceback
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Установка кодировки UTF-8 для вывода
-if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 # Добавляем корень проекта в путь
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-def test_imports():
-    """Проверка что все модули импортируются"""
-    print("Проверка импорта модулей...")
+from config import CARBON_TO_CO2_FACTOR
 
-    try:
-        from calculations.absorption_forest_restoration import ForestRestorationCalculator
-        print("  ✓ ForestRestorationCalculator")
-    except Exception as e:
-        print(f"  ✗ ForestRestorationCalculator: {e}")
-        return False
+# Проверяемые модули: (модуль, класс)
+MODULES = [
+    ("calculations.absorption_forest_restoration", "ForestRestorationCalculator"),
+    ("calculations.absorption_permanent_forest", "PermanentForestCalculator"),
+    ("calculations.absorption_agricultural", "AgriculturalLandCalculator"),
+    ("calculations.custom_formula_evaluator", "CustomFormulaEvaluator"),
+]
 
-    try:
-        from calculations.absorption_permanent_forest import PermanentForestCalculator
-        print("  ✓ PermanentForestCalculator")
-    except Exception as e:
-        print(f"  ✗ PermanentForestCalculator: {e}")
-        return False
+# Вывод копится в буфере и сбрасывается в stdout один раз на тест
+_buf = io.StringIO()
+log = partial(print, file=_buf)
 
-    try:
-        from calculations.absorption_agricultural import AgriculturalAbsorptionCalculator
-        print("  ✓ AgriculturalAbsorptionCalculator")
-    except Exception as e:
-        print(f"  ✗ AgriculturalAbsorptionCalculator: {e}")
-        return False
 
-    try:
-        from calculations.custom_formula_evaluator import CustomFormulaEvaluator
-        print("  ✓ CustomFormulaEvaluator")
-    except Exception as e:
-        print(f"  ✗ CustomFormulaEvaluator: {e}")
-        return False
+def _flush():
+    """Пишет накопленный вывод в stdout и очищает буфер"""
+    sys.stdout.write(_buf.getvalue())
+    _buf.seek(0)
+    _buf.truncate()
+
+
+# Классы, найденные в test_imports; остальные тесты берут их отсюда
+_RESOLVED = {}
+
+
+@lru_cache(maxsize=None)
+def _import(module_name):
+    """Импортирует модуль один раз за запуск"""
+    return importlib.import_module(module_name)
+
+
+def _resolve(module_name, class_name):
+    """Класс из модуля; найденные классы запоминаются в _RESOLVED"""
+    if class_name not in _RESOLVED:
+        _RESOLVED[class_name] = getattr(_import(module_name), class_name)
+    return _RESOLVED[class_name]
+
+
+def test_imports():
+    """Проверка что все модули импортируются"""
+    log("Проверка импорта модулей...")
+
+    for module_name, class_name in MODULES:
+        try:
+            _resolve(module_name, class_name)
+            log(f"  ✓ {class_name}")
+        except Exception as e:
+            log(f"  ✗ {class_name}: {e}")
+            return False
 
     return True
 
 def test_basic_calculations():
     """Тест базовых расчетов"""
-    print("\nТестирование базовых расчетов...")
-
-    from calculations.absorption_forest_restoration import ForestRestorationCalculator
+    log("\nТестирование базовых расчетов...")
 
-    calc = ForestRestorationCalculator()
+    calc = _resolve("calculations.absorption_forest_restoration", "ForestRestorationCalculator")()
 
     # Тест Ф.1
     result = calc.calculate_carbon_stock_change(100, 10, 5, 20)
     expected = 135.0
     if abs(result - expected) < 0.01:
-        print(f"  ✓ Ф.1 Изменение запасов C: {result:.2f} т C/год")
+        log(f"  ✓ Ф.1 Изменение запасов C: {result:.2f} т C/год")
     else:
-        print(f"  ✗ Ф.1: получено {result}, ожидалось {expected}")
+        log(f"  ✗ Ф.1: получено {result}, ожидалось {expected}")
         return False
 
     # Тест Ф.2
     result = calc.calculate_biomass_change(50, 30, 100, 10)
     expected = 200.0
     if abs(result - expected) < 0.01:
-        print(f"  ✓ Ф.2 Изменение биомассы: {result:.2f} т C/год")
+        log(f"  ✓ Ф.2 Изменение биомассы: {result:.2f} т C/год")
     else:
-        print(f"  ✗ Ф.2: получено {result}, ожидалось {expected}")
+        log(f"  ✗ Ф.2: получено {result}, ожидалось {expected}")
         return False
 
     # Тест Ф.11
-    result = calc.carbon_to_co2_conversion(100)
-    expected = 100 * (44/12)
+    result = calc.carbon_to_co2(100)
+    expected = -100 * CARBON_TO_CO2_FACTOR  # прирост запасов - поглощение
     if abs(result - expected) < 0.01:
-        print(f"  ✓ Ф.11 C->CO2: {result:.2f} т CO2")
+        log(f"  ✓ Ф.11 C->CO2: {result:.2f} т CO2")
     else:
-        print(f"  ✗ Ф.11: получено {result}, ожидалось {expected}")
+        log(f"  ✗ Ф.11: получено {result}, ожидалось {expected}")
         return False
 
     # Тест Ф.12 (GWP конверсия)
-    result = calc.ghg_to_co2_equivalent(10, "CH4")
+    result = calc.to_co2_equivalent(10, "CH4")
     expected = 10 * 28  # GWP CH4 = 28
     if abs(result - expected) < 0.01:
-        print(f"  ✓ Ф.12 CH4->CO2-экв: {result:.2f} т CO2-экв")
+        log(f"  ✓ Ф.12 CH4->CO2-экв: {result:.2f} т CO2-экв")
     else:
-        print(f"  ✗ Ф.12: получено {result}, ожидалось {expected}")
+        log(f"  ✗ Ф.12: получено {result}, ожидалось {expected}")
         return False
 
     return True
 
 def test_custom_formulas():
     """Тест пользовательских формул"""
-    print("\nТестирование пользовательских формул...")
-
-    from calculations.custom_formula_evaluator import CustomFormulaEvaluator
+    log("\nТестирование пользовательских формул...")
 
-    evaluator = CustomFormulaEvaluator()
+    evaluator = _resolve("calculations.custom_formula_evaluator", "CustomFormulaEvaluator")()
 
     # Простая формула
     formula = "E = FC * EF"
@@ -110,12 +128,12 @@ def test_custom_formulas():
         result = evaluator.evaluate(formula, variables)
         expected = 150.0
         if abs(result - expected) < 0.01:
-            print(f"  ✓ Простая формула: {result:.2f}")
+            log(f"  ✓ Простая формула: {result:.2f}")
         else:
-            print(f"  ✗ Результат {result} != {expected}")
+            log(f"  ✗ Результат {result} != {expected}")
             return False
     except Exception as e:
-        print(f"  ✗ Ошибка: {e}")
+        log(f"  ✗ Ошибка: {e}")
         return False
 
     # Формула с математическими функциями
@@ -126,21 +144,21 @@ def test_custom_formulas():
         result = evaluator.evaluate(formula, variables)
         expected = 50.0
         if abs(result - expected) < 0.01:
-            print(f"  ✓ Формула с sqrt: {result:.2f}")
+            log(f"  ✓ Формула с sqrt: {result:.2f}")
         else:
-            print(f"  ✗ Результат {result} != {expected}")
+            log(f"  ✗ Результат {result} != {expected}")
             return False
     except Exception as e:
-        print(f"  ✗ Ошибка: {e}")
+        log(f"  ✗ Ошибка: {e}")
         return False
 
     return True
 
 def main():
-    print("="*80)
-    print("ТЕСТИРОВАНИЕ РАБОТОСПОСОБНОСТИ РАСЧЕТОВ")
-    print("="*80)
-    print()
+    log("="*80)
+    log("ТЕСТИРОВАНИЕ РАБОТОСПОСОБНОСТИ РАСЧЕТОВ")
+    log("="*80)
+    log()
 
     tests = [
         ("Импорт модулей", test_imports),
@@ -152,36 +170,37 @@ def main():
     failed = 0
 
     for test_name, test_func in tests:
-        print(f"\n{'='*80}")
-        print(f"Тест: {test_name}")
-        print(f"{'='*80}")
+        log(f"\n{'='*80}")
+        log(f"Тест: {test_name}")
+        log(f"{'='*80}")
         try:
             if test_func():
-                print(f"\n✓ {test_name}: PASSED")
+                log(f"\n✓ {test_name}: PASSED")
                 passed += 1
             else:
-                print(f"\n✗ {test_name}: FAILED")
+                log(f"\n✗ {test_name}: FAILED")
                 failed += 1
         except Exception as e:
-            print(f"\n✗ {test_name}: ERROR")
-            print(f"Ошибка: {e}")
-            import traceback
+            log(f"\n✗ {test_name}: ERROR")
+            log(f"Ошибка: {e}")
+            _flush()
             traceback.print_exc()
             failed += 1
+        _flush()
 
-    print()
-    print("="*80)
-    print("ИТОГИ")
-    print("="*80)
-    print(f"Успешно: {passed}/{len(tests)}")
-    print(f"Провалено: {failed}/{len(tests)}")
+    log()
+    log("="*80)
+    log("ИТОГИ")
+    log("="*80)
+    log(f"Успешно: {passed}/{len(tests)}")
+    log(f"Провалено: {failed}/{len(tests)}")
 
     if failed == 0:
-        print("\n✓ Все расчеты работают корректно!")
-        return 0
+        log("\n✓ Все расчеты работают корректно!")
     else:
-        print(f"\n✗ Обнаружены проблемы в {failed} тестах")
-        return 1
+        log(f"\n✗ Обнаружены проблемы в {failed} тестах")
+    _flush()
+    return 0 if failed == 0 else 1
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,32 @@
+# tests/conftest.py
+"""
+Общие фикстуры тестов.
+"""
+
+import pytest
+
+import calculations.custom_formula_evaluator as custom_formula_evaluator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_formula_cache(tmp_path_factory):
+    """
+    Направляет дисковый кэш формул во временный каталог.
+
+    Кэш сохраняется при выходе из процесса (atexit), уже после завершения
+    фикстур, поэтому подмена пути не отменяется: иначе тесты записали бы
+    ~/.ghg_calculator/formula_cache.bin пользователя.
+    """
+    custom_formula_evaluator.FORMULA_CACHE_FILE = (
+        tmp_path_factory.mktemp("formula_cache") / "formula_cache.bin"
+    )
+
+
+@pytest.fixture(scope="class")
+def calc(request):
+    """
+    Калькулятор без состояния - один экземпляр на все тесты класса.
+
+    Класс калькулятора задается атрибутом calculator_class тестового класса.
+    """
+    return request.cls.calculator_class()
@@ -9,16 +9,27 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from ui.main_window_extended import ExtendedMainWindow
+import pytest
 
+from ui.main_window_extended import ExtendedMainWindow
 
-def test_extract_number_from_result():
-    """Тестирует извлечение чисел из текста результатов."""
 
-    # Создаем экземпляр окна
+def _create_window():
+    """Создает главное окно (и QApplication, если его еще нет)."""
     from PyQt6.QtWidgets import QApplication
     app = QApplication.instance() or QApplication(sys.argv)
-    window = ExtendedMainWindow()
+    return app, ExtendedMainWindow()
+
+
+@pytest.fixture(scope="module")
+def window():
+    """Главное окно строится один раз на модуль: создание всех вкладок дорогое."""
+    app, window = _create_window()
+    yield window
+
+
+def test_extract_number_from_result(window):
+    """Тестирует извлечение чисел из текста результатов."""
 
     print("=" * 60)
     print("ТЕСТИРОВАНИЕ ИЗВЛЕЧЕНИЯ ЧИСЕЛ ИЗ РЕЗУЛЬТАТОВ")
@@ -91,13 +102,9 @@ def test_extract_number_from_result():
     print("=" * 60)
 
 
-def test_balance_calculation():
+def test_balance_calculation(window):
     """Тестирует расчет баланса с заданными данными."""
 
-    from PyQt6.QtWidgets import QApplication
-    app = QApplication.instance() or QApplication(sys.argv)
-    window = ExtendedMainWindow()
-
     print("\n" + "=" * 60)
     print("ТЕСТИРОВАНИЕ РАСЧЕТА БАЛАНСА")
     print("=" * 60)
@@ -134,13 +141,9 @@ def test_balance_calculation():
     print("=" * 60)
 
 
-def test_balance_with_mock_data():
+def test_balance_with_mock_data(window):
     """Тестирует расчет баланса с тестовыми данными."""
 
-    from PyQt6.QtWidgets import QApplication
-    app = QApplication.instance() or QApplication(sys.argv)
-    window = ExtendedMainWindow()
-
     print("\n" + "=" * 60)
     print("ТЕСТИРОВАНИЕ С ТЕСТОВЫМИ ДАННЫМИ")
     print("=" * 60)
@@ -162,10 +165,15 @@ def test_balance_with_mock_data():
         # Симулируем наличие результата
         # (в реальном приложении это происходит после расчета)
         if hasattr(first_tab, 'result_label'):
+            # Окно общее для модуля - возвращаем исходный текст после теста
+            previous_text = first_tab.result_label.text()
             first_tab.result_label.setText('Результат: 1000.50 тонн CO2')
 
             # Пересчитываем баланс
-            total_emissions, emissions_by_cat, em_count = window._calculate_total_emissions()
+            try:
+                total_emissions, emissions_by_cat, em_count = window._calculate_total_emissions()
+            finally:
+                first_tab.result_label.setText(previous_text)
 
             print(f"[OK] Найдено выбросов: {total_emissions:.4f} т CO2-экв")
             print(f"[OK] Из категорий: {em_count}")
@@ -186,14 +194,53 @@ def test_balance_with_mock_data():
     print("=" * 60)
 
 
+def test_balance_reuses_unchanged_results(window):
+    """Повторный расчет баланса не разбирает неизменившийся текст результата."""
+
+    first_tab = window.emissions_tabs.widget(0)
+    # Ленивая вкладка: создаем реальный виджет, которому get_data передает вызов
+    if hasattr(first_tab, 'ensure_loaded'):
+        first_tab.ensure_loaded()
+        first_tab = first_tab.get_real_widget()
+    if not hasattr(first_tab, 'result_label'):
+        pytest.skip("У вкладки нет result_label")
+
+    previous_text = first_tab.result_label.text()
+    calls = []
+    original_extract = window._extract_number_from_result
+
+    def counting_extract(result_text):
+        calls.append(result_text)
+        return original_extract(result_text)
+
+    window._extract_number_from_result = counting_extract
+    try:
+        first_tab.result_label.setText('Результат: 1000.50 тонн CO2')
+        total_first = window._calculate_total_emissions()[0]
+        calls.clear()
+
+        # Текст не менялся - значение берется из кэша
+        assert window._calculate_total_emissions()[0] == total_first
+        assert 'Результат: 1000.50 тонн CO2' not in calls
+
+        # Новый текст разбирается заново
+        first_tab.result_label.setText('Результат: 250 т CO2')
+        assert window._calculate_total_emissions()[0] == total_first - 1000.50 + 250.0
+    finally:
+        del window._extract_number_from_result
+        first_tab.result_label.setText(previous_text)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("ЗАПУСК ТЕСТОВ БАЛАНСА ПАРНИКОВЫХ ГАЗОВ")
     print("=" * 60)
 
-    test_extract_number_from_result()
-    test_balance_calculation()
-    test_balance_with_mock_data()
+    app, window = _create_window()
+    test_extract_number_from_result(window)
+    test_balance_calculation(window)
+    test_balance_with_mock_data(window)
+    test_balance_reuses_unchanged_results(window)
 
     print("\n" + "=" * 60)
     print("[SUCCESS] ВСЕ ТЕСТЫ УСПЕШНО ЗАВЕРШЕНЫ!")
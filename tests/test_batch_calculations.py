@@ -0,0 +1,141 @@
+# tests/test_batch_calculations.py
+"""
+Тесты пакетных (*_batch) расчетов поглощения ПГ.
+Пакетный расчет должен давать те же значения, что и поштучный.
+"""
+
+import pytest
+
+from calculations.absorption_agricultural import AgriculturalLandCalculator
+from calculations.absorption_forest_restoration import ForestRestorationCalculator
+from calculations.absorption_permanent_forest import (
+    PermanentForestCalculator,
+    ProtectiveForestCalculator,
+)
+from calculations.gwp_constants import get_co2_equivalent, get_co2_equivalent_batch
+
+FOREST = ForestRestorationCalculator()
+PERMANENT = PermanentForestCalculator()
+PROTECTIVE = ProtectiveForestCalculator()
+AGRICULTURAL = AgriculturalLandCalculator()
+
+# Ряды бюджетов формул 35 и 54: поглощение, потери от рубок, потери от пожаров
+BUDGET_COLUMNS = (
+    [1000.0 + i for i in range(1000)],
+    [400.0 - 0.25 * i for i in range(1000)],
+    [0.1 * i for i in range(1000)],
+)
+
+
+@pytest.mark.parametrize(
+    "batch, scalar, columns, shared",
+    [
+        pytest.param(FOREST.calculate_biomass_change_batch, FOREST.calculate_biomass_change,
+                     ([150.0, 80.0], [50.0, 60.0], [100.0, 35.0], [20.0, 7.0]), (),
+                     id="formula_2"),
+        pytest.param(FOREST.calculate_tree_biomass_batch, FOREST.calculate_tree_biomass,
+                     ([30.0, 25.0, 18.5, 40.0], [25.0, 20.0, 16.0, 30.0],
+                      ["ель", "береза", "сосна", "береза"]), (),
+                     id="formula_3"),
+        pytest.param(FOREST.calculate_soil_carbon_batch, FOREST.calculate_soil_carbon,
+                     ([3.5, 1.2, 6.0], [30.0, 20.0, 50.0], [1.2, 1.45, 0.9]), (),
+                     id="formula_5"),
+        pytest.param(FOREST.calculate_drained_soil_n2o_batch, FOREST.calculate_drained_soil_n2o,
+                     ([0.5, 100.0, 2500.0],), (1.71,),
+                     id="formula_8"),
+        pytest.param(FOREST.carbon_to_co2_batch, FOREST.carbon_to_co2,
+                     ([100.0, -50.0, 0.0, 12.5],), (),
+                     id="formula_11"),
+        pytest.param(PERMANENT.calculate_mean_carbon_per_hectare_batch,
+                     PERMANENT.calculate_mean_carbon_per_hectare,
+                     ([1000.0, 730.0, 12.5], [50.0, 33.0, 0.4]), (),
+                     id="formula_28"),
+        pytest.param(PERMANENT.calculate_annual_disturbance_rate_fire_batch,
+                     PERMANENT.calculate_annual_disturbance_rate_fire,
+                     ([500.0, 120.0, 7.0], [50.0, 30.0, 3.0]), (),
+                     id="formula_31"),
+        pytest.param(PERMANENT.calculate_biomass_budget_batch, PERMANENT.calculate_biomass_budget,
+                     BUDGET_COLUMNS, (),
+                     id="formula_35"),
+        pytest.param(PERMANENT.calculate_soil_budget_batch, PERMANENT.calculate_soil_budget,
+                     BUDGET_COLUMNS, (),
+                     id="formula_54"),
+        pytest.param(PERMANENT.calculate_total_budget_batch, PERMANENT.calculate_total_budget,
+                     ([500.0, -12.5, 0.1], [50.0, 0.3, 0.2], [30.0, 1.7, 0.3], [120.0, -4.0, 0.4]), (),
+                     id="formula_55"),
+        pytest.param(PROTECTIVE.calculate_protective_total_accumulation_batch,
+                     PROTECTIVE.calculate_protective_total_accumulation,
+                     ([500.0, 1.1], [30.0, 2.2], [20.0, 3.3], [300.0, 4.4]), (),
+                     id="formula_72"),
+        pytest.param(AGRICULTURAL.calculate_drained_ch4_emissions_batch,
+                     AGRICULTURAL.calculate_drained_ch4_emissions,
+                     ([0.0, 12.5, 100.0, 3456.7],), (0.1, 2.0, 40.0),
+                     id="formula_75"),
+        pytest.param(get_co2_equivalent_batch, get_co2_equivalent,
+                     ([10.0, 5.0, 1000.0, 0.01], ["CH4", "N2O", "CO2", "SF6"]), (),
+                     id="gwp"),
+    ],
+)
+def test_batch_matches_scalar(batch, scalar, columns, shared):
+    """Пакетный расчет совпадает с поштучным (побитово, без допуска)."""
+    result = batch(*columns, *shared)
+
+    assert result == [scalar(*row, *shared) for row in zip(*columns)]
+
+
+@pytest.mark.parametrize(
+    "batch, columns, message",
+    [
+        pytest.param(FOREST.calculate_biomass_change_batch,
+                     ([150.0, 80.0], [50.0, 60.0], [100.0, 35.0], [20.0, 0.0]),
+                     "Период должен быть больше 0", id="formula_2"),
+        pytest.param(PERMANENT.calculate_mean_carbon_per_hectare_batch,
+                     ([1000.0, 730.0, 12.5], [50.0, 0.0, 0.4]),
+                     "Площадь должна быть больше 0", id="formula_28"),
+        pytest.param(PERMANENT.calculate_annual_disturbance_rate_fire_batch,
+                     ([500.0, 120.0, 7.0], [50.0, 0.0, 3.0]),
+                     "Период ротации должен быть больше 0", id="formula_31"),
+        pytest.param(get_co2_equivalent_batch,
+                     ([1.0], ["HFC-134a"]),
+                     "Неизвестный тип газа", id="gwp"),
+    ],
+)
+def test_batch_rejects_invalid_values(batch, columns, message):
+    """Недопустимое значение в любом элементе ряда отклоняет весь пакет."""
+    with pytest.raises(ValueError, match=message):
+        batch(*columns)
+
+
+@pytest.mark.parametrize(
+    "batch, columns",
+    [
+        pytest.param(FOREST.calculate_biomass_change_batch,
+                     ([150.0, 80.0], [50.0, 60.0], [100.0], [20.0, 7.0]), id="formula_2"),
+        pytest.param(FOREST.calculate_tree_biomass_batch,
+                     ([20.0, 24.0], [18.0, 21.0], ["ель"]), id="formula_3"),
+        pytest.param(FOREST.calculate_soil_carbon_batch,
+                     ([4.5], [30.0, 20.0], [1.2, 1.1]), id="formula_5"),
+        pytest.param(PERMANENT.calculate_mean_carbon_per_hectare_batch,
+                     ([1000.0, 730.0], [50.0]), id="formula_28"),
+        pytest.param(PERMANENT.calculate_carbon_absorption_rates,
+                     ([10.0, 30.0, 55.0], [20.0, 20.0]), id="formula_29"),
+        pytest.param(PERMANENT.calculate_annual_disturbance_rate_fire_batch,
+                     ([500.0], [50.0, 30.0]), id="formula_31"),
+        pytest.param(PERMANENT.calculate_biomass_budget_batch,
+                     ([10.0, 12.0], [1.0, 2.0], [0.5]), id="formula_35"),
+        pytest.param(PERMANENT.calculate_soil_absorption_rates,
+                     ([60.0, 58.0], [40.0, 20.0, 10.0]), id="formula_50"),
+        pytest.param(PERMANENT.calculate_soil_budget_batch,
+                     ([10.0], [1.0, 2.0], [0.5, 0.1]), id="formula_54"),
+        pytest.param(PERMANENT.calculate_total_budget_batch,
+                     ([1.0, 2.0], [1.0, 2.0], [1.0, 2.0], [1.0]), id="formula_55"),
+        pytest.param(PROTECTIVE.calculate_protective_total_accumulation_batch,
+                     ([1.0], [1.0, 2.0], [1.0, 2.0], [1.0, 2.0]), id="formula_72"),
+        pytest.param(get_co2_equivalent_batch,
+                     ([10.0, 5.0], ["CH4"]), id="gwp"),
+    ],
+)
+def test_batch_rejects_columns_of_different_length(batch, columns):
+    """Ряды разной длины отклоняются, а не обрезаются молча по кратчайшему."""
+    with pytest.raises(ValueError, match="разной длины"):
+        batch(*columns)
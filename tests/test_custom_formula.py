@@ -4,12 +4,14 @@
 Проверяет парсинг пользовательских формул и вычисление блоков суммирования.
 """
 
+import marshal
 import pytest
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import calculations.custom_formula_evaluator as custom_formula_evaluator
 from calculations.custom_formula_evaluator import CustomFormulaEvaluator
 
 
@@ -98,6 +100,39 @@ class TestCustomFormulaEvaluator:
 
         assert result == expected, f"Ожидалось {expected}, получено {result}"
 
+    def test_sum_block_matches_element_formulas(self):
+        """Блок суммирования совпадает с суммой формул, вычисленных по отдельности"""
+        evaluator = CustomFormulaEvaluator()
+        expression_template = "FC_j * EF_j / (1 + k_j)"
+
+        variables_by_index = [
+            {f'FC_{i}': 10.0 * i, f'EF_{i}': 0.7 + i, f'k_{i}': 0.01 * i}
+            for i in range(1, 13)
+        ]
+
+        result = evaluator.evaluate_sum_block(expression_template, variables_by_index)
+
+        expected = 0.0
+        for i, variables in enumerate(variables_by_index, start=1):
+            expected += evaluator.evaluate(f"FC_{i} * EF_{i} / (1 + k_{i})", variables)
+        assert result == expected
+
+    def test_sum_block_missing_variable_reports_element(self):
+        """Ошибка в блоке суммирования указывает номер элемента"""
+        evaluator = CustomFormulaEvaluator()
+
+        with pytest.raises(ValueError, match="элемента 2 .*Отсутствуют значения для переменных: EF_2"):
+            evaluator.evaluate_sum_block("FC_j * EF_j", [{'FC_1': 1, 'EF_1': 2}, {'FC_2': 3}])
+
+    def test_parse_variables_returns_independent_sets(self):
+        """Повторный разбор формулы не зависит от изменений ранее возвращенного множества"""
+        evaluator = CustomFormulaEvaluator()
+
+        first = evaluator.parse_variables("FC * EF * OF")
+        first.add("extra")
+
+        assert evaluator.parse_variables("FC * EF * OF") == {"FC", "EF", "OF"}
+
     def test_invalid_formula_raises_error(self):
         """Проверка, что некорректная формула вызывает ошибку"""
         evaluator = CustomFormulaEvaluator()
@@ -112,6 +147,17 @@ class TestCustomFormulaEvaluator:
         with pytest.raises(ValueError, match="Отсутствуют значения для переменных"):
             evaluator.evaluate("a * b", {'a': 10})  # b отсутствует
 
+    @pytest.mark.parametrize("formula, variables, expected", [
+        ("E = exp(x)", {'x': 1000}, float('inf')),
+        ("E = -exp(x)", {'x': 1000}, float('-inf')),
+        ("E = x**2", {'x': 10**200}, float('inf')),
+    ])
+    def test_overflow_returns_infinity(self, formula, variables, expected):
+        """Переполнение float дает ±inf, а не ошибку вычисления"""
+        evaluator = CustomFormulaEvaluator()
+
+        assert evaluator.evaluate(formula, variables) == expected
+
     def test_real_world_emissions_formula(self):
         """
         Реальный пример: E_CO2_y = FC_y * EF_CO2_y * OF_y
@@ -133,5 +179,23 @@ class TestCustomFormulaEvaluator:
         assert abs(result - expected) < 1e-6, f"Ожидалось {expected}, получено {result}"
 
 
+def test_code_cache_drops_malformed_entries(tmp_path, monkeypatch):
+    """Поврежденные записи дискового кэша отбрасываются при загрузке."""
+    valid_code = (lambda a, b: a * b).__code__
+    cache_file = tmp_path / "formula_cache.bin"
+    with open(cache_file, 'wb') as f:
+        marshal.dump((custom_formula_evaluator._CODE_CACHE_VERSION, {
+            'a*b': (('a', 'b'), valid_code),
+            'c': (('c',), "не код"),
+            'd': ['d', valid_code],
+            'e': ((1,), valid_code),
+            'f': (('f',), valid_code),  # Число аргументов не совпадает
+        }), f)
+    monkeypatch.setattr(custom_formula_evaluator, "FORMULA_CACHE_FILE", cache_file)
+    monkeypatch.setattr(custom_formula_evaluator, "_code_cache", None)
+
+    assert list(custom_formula_evaluator._load_code_cache()) == ['a*b']
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
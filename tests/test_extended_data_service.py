@@ -0,0 +1,111 @@
+# tests/test_extended_data_service.py
+"""
+Модульные тесты для расширенного сервиса данных (таблицы поглощения ПГ).
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Добавляем родительскую директорию в путь для импорта модулей
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_models_extended import (
+    ExtendedDataService, SPECIES, FRACTION, GAS, GAS_IDX, LAND_TYPE, _allometric_coefficients,
+)
+
+
+@pytest.fixture
+def service():
+    """Экземпляр сервиса данных."""
+    return ExtendedDataService()
+
+
+class TestInternedKeys:
+    """Тесты интернированных ключей таблиц"""
+
+    def test_constants_are_table_keys(self, service):
+        """Константы совпадают по идентичности с ключами таблиц"""
+        keys = list(service.allometric_coefficients)
+        assert keys[0] is SPECIES.SPRUCE
+        assert FRACTION.TOTAL in service.allometric_coefficients[SPECIES.PINE]
+
+    def test_lookup_by_constant_and_by_string(self, service):
+        """Поиск работает как по константам, так и по обычным строкам"""
+        by_const = service.get_allometric_coefficients(SPECIES.BIRCH, FRACTION.ABOVE)
+        by_str = service.get_allometric_coefficients('Береза', 'надземная')
+        assert by_const == by_str == {'a': 0.5443, 'b': 0.6527}
+
+    def test_fire_emission_factor(self, service):
+        """Коэффициент выбросов при пожаре по интернированным ключам"""
+        assert service.get_fire_emission_factor(LAND_TYPE.FOREST, GAS.CH4) == 4.7
+        assert service.get_fire_emission_factor('леса', 'CO2') == 1569.0
+        assert service.get_fire_emission_factor('неизвестно', GAS.CO2) is None
+        assert service.get_fire_emission_factor(LAND_TYPE.FOREST, 'SF6') is None
+
+    def test_fire_emission_rows_follow_gas_index(self, service):
+        """Строки таблицы пожаров упорядочены по GAS_IDX"""
+        row = service.fire_emission_factors[LAND_TYPE.CROP_RESIDUES]
+        assert row[GAS_IDX[GAS.N2O]] == 0.07
+
+
+class TestRegionalCarbonStocks:
+    """Тесты региональных запасов углерода"""
+
+    def test_record_fields(self, service):
+        """Запись региона доступна по именам полей"""
+        data = service.get_regional_carbon_stocks('Республика Алтай')
+        assert data.region == 'Республика Алтай'
+        assert data.above_biomass == 55.08
+        assert data.shrub_soil == 96.54
+
+    def test_record_has_no_instance_dict(self, service):
+        """Запись хранится как кортеж без __dict__"""
+        data = service.get_regional_carbon_stocks('Республика Адыгея')
+        assert isinstance(data, tuple)
+        assert not hasattr(data, '__dict__')
+
+    def test_unknown_region(self, service):
+        """Для неизвестного региона возвращается None"""
+        assert service.get_regional_carbon_stocks('Неизвестный регион') is None
+
+    def test_total_carbon(self, service):
+        """Суммарный запас углерода совпадает с суммой пулов"""
+        data = service.get_regional_carbon_stocks('Республика Бурятия')
+        expected = (data.above_biomass + data.below_biomass + data.deadwood
+                    + data.litter + data.soil)
+        assert service.get_total_carbon('Республика Бурятия') == pytest.approx(expected)
+        assert service.get_total_carbon('Неизвестный регион') is None
+
+    def test_total_carbon_all(self, service):
+        """Суммарные запасы рассчитаны для всех регионов"""
+        totals = service.get_total_carbon_all()
+        assert set(totals) == set(service.regional_carbon_stocks)
+
+
+class TestServiceLayout:
+    """Тесты устройства сервиса"""
+
+    def test_slots_cover_all_tables(self, service):
+        """Все таблицы хранятся в слотах, __dict__ отсутствует"""
+        assert not hasattr(service, '__dict__')
+        for name in ExtendedDataService.__slots__:
+            assert getattr(service, name) is not None
+
+    def test_accessors_are_memoized(self, service):
+        """Повторные запросы к таблицам берутся из кэша"""
+        service.get_allometric_coefficients('ЕЛЬ')
+        service.get_allometric_coefficients('ЕЛЬ')
+        info = _allometric_coefficients.cache_info()
+        assert info.hits >= 1
+
+    def test_cache_does_not_keep_service_alive(self):
+        """Кэш справочников не хранит ссылок на экземпляр сервиса"""
+        service = ExtendedDataService()
+        refs_before = sys.getrefcount(service)
+
+        service.get_allometric_coefficients('ЕЛЬ')
+        service.get_regional_carbon_stocks('Московская область')
+        service.get_livestock_carbon_factors('КРС')
+
+        assert sys.getrefcount(service) == refs_before
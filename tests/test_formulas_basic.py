@@ -14,7 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import CARBON_TO_CO2_FACTOR, N2O_N_TO_N2O_FACTOR
 from calculations.category_0 import Category0Calculator
 from calculations.category_1 import Category1Calculator
-from calculations.gwp_constants import get_co2_equivalent, carbon_to_co2, nitrogen_to_n2o
+from calculations.gwp_constants import (
+    get_co2_equivalent, carbon_to_co2, nitrogen_to_n2o
+)
 
 
 class TestConstants:
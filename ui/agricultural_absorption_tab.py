@@ -15,7 +15,7 @@ from PyQt6.QtGui import QDoubleValidator, QIntValidator
 from PyQt6.QtCore import Qt, QLocale
 
 from calculations.absorption_agricultural import AgriculturalLandCalculator, CropData, LivestockData
-from data_models_extended import DataService
+from data_models_extended import DataService, GAS_IDX, LAND_TYPE
 
 from ui.tab_data_mixin import TabDataMixin
 from ui.absorption_utils import create_line_edit, get_float, handle_error
@@ -156,7 +156,7 @@ class AgriculturalAbsorptionTab(TabDataMixin, QWidget):
         self.agri_fire_comb_factor = create_line_edit(self, "0.8", (0.01, 1.0, 3), tooltip="Коэффициент сгорания (доля)")
         fire_layout.addRow("Коэф. сгорания (доля):", self.agri_fire_comb_factor)
         self.agri_fire_gas_type = QComboBox()
-        gas_factors = self.data_service.fire_emission_factors.get('сельхоз_остатки', {}); self.agri_fire_gas_type.addItems(gas_factors.keys())
+        self.agri_fire_gas_type.addItems(list(GAS_IDX))
         fire_layout.addRow("Тип газа:", self.agri_fire_gas_type)
         calc_fire_btn = QPushButton("Рассчитать выброс от пожара (Ф. 76/90)"); calc_fire_btn.clicked.connect(self._calculate_agricultural_fire)
         fire_layout.addRow(calc_fire_btn)
@@ -233,7 +233,7 @@ class AgriculturalAbsorptionTab(TabDataMixin, QWidget):
     def _calculate_agricultural_fire(self):
         try:
             area = get_float(self.agri_fire_area, "Площадь пожара"); biomass = get_float(self.agri_fire_biomass, "Масса биомассы"); comb_factor = get_float(self.agri_fire_comb_factor, "Коэф. сгорания"); gas_type = self.agri_fire_gas_type.currentText()
-            ef_value = self.data_service.get_fire_emission_factor('сельхоз_остатки', gas_type)
+            ef_value = self.data_service.get_fire_emission_factor(LAND_TYPE.CROP_RESIDUES, gas_type)
             if ef_value is None: raise ValueError(f"Коэффициент выброса для {gas_type} не найден.")
             emission = self.calculator.calculate_agricultural_fire_emissions(area=area, biomass=biomass, combustion=comb_factor, emission_factor=ef_value)
             result = (f"Выбросы от пожара (Ф. 76/90):\nПлощадь={area:.2f} га, Биомасса={biomass:.2f} т/га, К сгор.={comb_factor:.3f}\nВыбросы {gas_type}: {emission:.4f} т")
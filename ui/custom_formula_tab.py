@@ -1261,8 +1261,9 @@ class CustomFormulaTab(QWidget):
 if __name__ == "__main__":
     import sys
     from PyQt6.QtWidgets import QApplication
+    from logger_config import setup_logging
     
-    logging.basicConfig(level=logging.DEBUG)
+    setup_logging(logging.DEBUG)
     
     app = QApplication(sys.argv)
     window = CustomFormulaTab()
@@ -5,6 +5,7 @@
 """
 import logging
 import json
+import re
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QMenuBar, QMenu,
@@ -31,6 +32,14 @@ from ui.custom_formula_tab import CustomFormulaTab
 # Импорт ленивой загрузки вкладок
 from ui.lazy_tab_widget import LazyTabWidget
 
+# Шаблоны поиска числа в тексте результата вкладки, в порядке приоритета.
+# Поддерживаем форматы: 1234.56, 1,234.56, 1234,56
+_RESULT_NUMBER_PATTERNS = (
+    re.compile(r'(\d+(?:[.,]\d+)?)\s*(?:тонн|т|т CO2|тCO2|кг|kg)'),
+    re.compile(r'[Рр]езультат[:\s]+(\d+(?:[.,]\d+)?)'),
+    re.compile(r'(\d+(?:[.,]\d+))'),
+)
+
 
 class ExtendedMainWindow(QMainWindow):
     """Главное окно приложения с расширенной функциональностью."""
@@ -38,6 +47,8 @@ class ExtendedMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.calculator_factory = ExtendedCalculatorFactory()
+        # Последний разобранный результат каждой вкладки: {вкладка: (текст, число)}
+        self._result_value_cache = {}
         self._init_ui()
         self._init_toolbar()
         self._init_statusbar()
@@ -825,7 +836,7 @@ class ExtendedMainWindow(QMainWindow):
                 result_text = data.get('result', '')
 
                 # Извлекаем числовое значение из текста результата
-                emission_value = self._extract_number_from_result(result_text)
+                emission_value = self._get_result_value(tab, result_text)
 
                 if emission_value is not None and emission_value > 0:
                     total_emissions += emission_value
@@ -864,7 +875,7 @@ class ExtendedMainWindow(QMainWindow):
                 result_text = data.get('result', '')
 
                 # Извлекаем числовое значение из текста результата
-                absorption_value = self._extract_number_from_result(result_text)
+                absorption_value = self._get_result_value(tab, result_text)
 
                 if absorption_value is not None and absorption_value > 0:
                     total_absorption += absorption_value
@@ -878,6 +889,20 @@ class ExtendedMainWindow(QMainWindow):
         logging.info(f"Total absorption calculated: {total_absorption:.4f} т CO2-экв from {successful_count} types")
         return total_absorption, absorption_by_type, successful_count
 
+    def _get_result_value(self, tab, result_text):
+        """
+        Числовое значение результата вкладки с кэшем по тексту результата.
+
+        Пока текст результата вкладки не изменился, повторный расчет баланса
+        берет число из кэша; новый текст разбирается заново.
+        """
+        cached = self._result_value_cache.get(tab)
+        if cached is not None and cached[0] == result_text:
+            return cached[1]
+        value = self._extract_number_from_result(result_text)
+        self._result_value_cache[tab] = (result_text, value)
+        return value
+
     def _extract_number_from_result(self, result_text):
         """
         Извлекает числовое значение из текста результата.
@@ -891,17 +916,9 @@ class ExtendedMainWindow(QMainWindow):
         if not result_text or not isinstance(result_text, str):
             return None
 
-        import re
         # Ищем числа с плавающей точкой в тексте
-        # Поддерживаем форматы: 1234.56, 1,234.56, 1234,56
-        patterns = [
-            r'(\d+(?:[.,]\d+)?)\s*(?:тонн|т|т CO2|тCO2|кг|kg)',
-            r'[Рр]езультат[:\s]+(\d+(?:[.,]\d+)?)',
-            r'(\d+(?:[.,]\d+))'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, result_text)
+        for pattern in _RESULT_NUMBER_PATTERNS:
+            match = pattern.search(result_text)
             if match:
                 try:
                     number_str = match.group(1).replace(',', '.')
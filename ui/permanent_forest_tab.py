@@ -15,7 +15,7 @@ from PyQt6.QtGui import QDoubleValidator, QIntValidator
 from PyQt6.QtCore import Qt, QLocale
 
 from calculations.absorption_permanent_forest import PermanentForestCalculator
-from data_models_extended import DataService
+from data_models_extended import DataService, LAND_TYPE
 
 from ui.tab_data_mixin import TabDataMixin
 from ui.absorption_utils import create_line_edit, get_float, handle_error
@@ -735,7 +735,7 @@ class PermanentForestTab(TabDataMixin, QWidget):
             fuel_mass = get_float(self.f59_fuel_mass, "Масса топлива (Ф.59)")
             comb_factor = get_float(self.f59_comb_factor, "Коэф. сгорания (Ф.59)")
             gas_type = self.f59_gas_type.currentText()
-            ef_value = self.data_service.get_fire_emission_factor('леса', gas_type)
+            ef_value = self.data_service.get_fire_emission_factor(LAND_TYPE.FOREST, gas_type)
             if ef_value is None: raise ValueError(f"Коэффициент выброса для {gas_type} (леса) не найден.")
             emission = self.calculator.calculate_forest_fire_emissions(area, fuel_mass, comb_factor, ef_value)
             result = f"Выбросы от пожара (Ф. 59) {gas_type}: {emission:.4f} т"